@@ -7,7 +7,7 @@ import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Set, Tuple
 import logging
 
 # Setup logging
@@ -23,15 +23,13 @@ class DatabaseManager:
         self.connection = None
         self.cursor = None
 
+        # Bumped on every write through this manager that changes the experiment list
+        self._experiments_version = 0
+
     def initialize(self):
         """Initialize the database and create tables if they don't exist."""
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row  # Enable column access by name
-            self.cursor = self.connection.cursor()
-
-            # Enable foreign keys
-            self.cursor.execute("PRAGMA foreign_keys = ON")
+            self.connect()
 
             # Create tables
             self.create_tables()
@@ -42,6 +40,30 @@ class DatabaseManager:
             logger.error(f"Database initialization error: {e}")
             raise
 
+    def connect(self):
+        """Open the connection without touching the schema.
+
+        initialize() calls this; use it directly for an extra connection to a
+        database another manager has already initialized.
+        """
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.row_factory = sqlite3.Row  # Enable column access by name
+        self.cursor = self.connection.cursor()
+
+        # Enable foreign keys
+        self.cursor.execute("PRAGMA foreign_keys = ON")
+
+    @property
+    def experiments_version(self) -> Tuple[int, int]:
+        """A value that changes whenever the experiments may have changed.
+
+        Combines this manager's own write counter with SQLite's data_version,
+        which changes when any other connection (the participant window,
+        another client) commits to the database file.
+        """
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        return self._experiments_version, data_version
+
     def create_tables(self):
         """Create all required database tables."""
         # Participants table
@@ -182,17 +204,38 @@ class DatabaseManager:
             return dict(row)
         return None
 
-    def get_all_participants(self) -> List[Dict]:
-        """Get all participants."""
+    def get_max_participant_number(self) -> int:
+        """Get the highest N among participant codes of the form P<digits>, or 0."""
+        self.cursor.execute("""
+            SELECT MAX(CAST(SUBSTR(participant_code, 2) AS INTEGER))
+            FROM participants
+            WHERE participant_code GLOB 'P[0-9]*'
+              AND SUBSTR(participant_code, 2) NOT GLOB '*[^0-9]*'
+        """)
+        return self.cursor.fetchone()[0] or 0
+
+    def get_all_participants(self, code_filter: str = None) -> List[Dict]:
+        """Get all participants.
+
+        Pass code_filter to only return participants whose code contains it
+        (case-insensitive, as LIKE is for ASCII).
+        """
+        # Escape LIKE wildcards; underscores are valid in participant codes
+        pattern = "%"
+        if code_filter:
+            escaped = code_filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%"
+
         self.cursor.execute("""
             SELECT p.*, 
                    COUNT(DISTINCT s.id) as session_count,
                    SUM(CASE WHEN s.completed = 1 THEN 1 ELSE 0 END) as completed_sessions
             FROM participants p
             LEFT JOIN sessions s ON p.id = s.participant_id
+            WHERE p.participant_code LIKE ? ESCAPE '\\'
             GROUP BY p.id
             ORDER BY p.created_date DESC
-        """)
+        """, (pattern,))
 
         return [dict(row) for row in self.cursor.fetchall()]
 
@@ -241,6 +284,7 @@ class DatabaseManager:
             """, (participant_id,))
 
             self.connection.commit()
+            self._experiments_version += 1  # enrollment counts may have changed
             logger.info(f"Deleted participant {participant_id} and all associated data")
 
         except sqlite3.Error as e:
@@ -267,11 +311,14 @@ class DatabaseManager:
                   start_date, end_date, max_participants, created_by))
 
             self.connection.commit()
+            self._experiments_version += 1
             experiment_id = self.cursor.lastrowid
             logger.info(f"Created experiment {experiment_code} with ID {experiment_id}")
             return experiment_id
 
         except sqlite3.IntegrityError:
+            # End the implicit transaction the failed INSERT opened
+            self.connection.rollback()
             logger.error(f"Experiment with code {experiment_code} already exists")
             raise ValueError(f"Experiment code {experiment_code} already exists")
 
@@ -296,17 +343,71 @@ class DatabaseManager:
             return experiment
         return None
 
-    def get_active_experiments(self) -> List[Dict]:
-        """Get all active experiments."""
+    def duplicate_experiment(self, experiment_id: int,
+                             code_generator: Callable[[Set[str]], str],
+                             created_by: str = None) -> Optional[Tuple[int, str]]:
+        """Copy an experiment under a new code in a single transaction.
+
+        code_generator receives the set of existing codes and returns an unused
+        one. Returns (new_id, new_code), or None if the source doesn't exist.
+        """
+        try:
+            # BEGIN fails inside an open transaction, so end any left behind
+            if self.connection.in_transaction:
+                self.connection.rollback()
+
+            # Take the write lock up front so no other writer can claim the code
+            self.cursor.execute("BEGIN IMMEDIATE")
+
+            new_code = code_generator(self.get_existing_experiment_codes())
+
+            self.cursor.execute("""
+                INSERT INTO experiments
+                (experiment_code, name, description, config, max_participants, created_by)
+                SELECT ?, name || ' (Copy)', description, config, max_participants, ?
+                FROM experiments WHERE id = ?
+            """, (new_code, created_by, experiment_id))
+
+            if self.cursor.rowcount == 0:
+                self.connection.rollback()
+                return None
+
+            self.connection.commit()
+            self._experiments_version += 1
+            new_id = self.cursor.lastrowid
+            logger.info(f"Duplicated experiment {experiment_id} as {new_code} with ID {new_id}")
+            return new_id, new_code
+
+        except sqlite3.Error:
+            self.connection.rollback()
+            raise
+
+    def get_existing_experiment_codes(self) -> Set[str]:
+        """Get the codes of all experiments, active or not."""
+        self.cursor.execute("SELECT experiment_code FROM experiments")
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def get_active_experiments(self, offset: int = 0, limit: int = None) -> List[Dict]:
+        """Get active experiments with their enrollment counts in one query.
+
+        Pass limit (and optionally offset) to fetch a single page; by default
+        all active experiments are returned.
+        """
+        # Count enrollments per experiment first so the wide experiment rows
+        # (including the config JSON) are never grouped
         self.cursor.execute("""
-            SELECT e.*, 
-                   COUNT(DISTINCT ee.participant_id) as enrolled_count
+            SELECT e.*,
+                   COALESCE(ec.enrolled_count, 0) as enrolled_count
             FROM experiments e
-            LEFT JOIN experiment_enrollment ee ON e.id = ee.experiment_id
+            LEFT JOIN (
+                SELECT experiment_id, COUNT(DISTINCT participant_id) as enrolled_count
+                FROM experiment_enrollment
+                GROUP BY experiment_id
+            ) ec ON e.id = ec.experiment_id
             WHERE e.is_active = 1
-            GROUP BY e.id
-            ORDER BY e.created_date DESC
-        """)
+            ORDER BY e.created_date DESC, e.id DESC
+            LIMIT ? OFFSET ?
+        """, (limit if limit is not None else -1, offset))
 
         experiments = []
         for row in self.cursor.fetchall():
@@ -346,6 +447,7 @@ class DatabaseManager:
             """, (experiment['id'], participant_id))
 
             self.connection.commit()
+            self._experiments_version += 1
             logger.info(f"Enrolled participant {participant_id} in experiment {experiment_code}")
             return True
 
@@ -389,6 +491,7 @@ class DatabaseManager:
 
         self.cursor.execute(query, values)
         self.connection.commit()
+        self._experiments_version += 1
         logger.info(f"Updated experiment {experiment_id}")
 
     def get_experiment_statistics(self, experiment_id: int) -> Dict:
@@ -409,7 +512,57 @@ class DatabaseManager:
         row = self.cursor.fetchone()
         stats.update(dict(row))
 
-        # Get trial statistics by task
+        stats['task_statistics'] = self._get_experiment_task_statistics(experiment_id)
+
+        return stats
+
+    def get_experiment_with_statistics(self, experiment_id: int) -> Tuple[Optional[Dict], Dict]:
+        """Get an experiment together with its statistics.
+
+        The experiment row and its enrollment/session counts come from a single
+        query, followed by one query for the per-task trial statistics.
+        """
+        self.cursor.execute("""
+            SELECT e.*,
+                   (SELECT COUNT(DISTINCT ee.participant_id)
+                    FROM experiment_enrollment ee
+                    WHERE ee.experiment_id = e.id) as participant_count,
+                   (SELECT COUNT(*)
+                    FROM sessions s
+                    WHERE s.experiment_id = e.id
+                      AND s.participant_id IN (
+                          SELECT participant_id FROM experiment_enrollment
+                          WHERE experiment_id = e.id
+                      )) as session_count,
+                   (SELECT COUNT(*)
+                    FROM sessions s
+                    WHERE s.experiment_id = e.id AND s.completed = 1
+                      AND s.participant_id IN (
+                          SELECT participant_id FROM experiment_enrollment
+                          WHERE experiment_id = e.id
+                      )) as completed_sessions
+            FROM experiments e
+            WHERE e.id = ?
+        """, (experiment_id,))
+
+        row = self.cursor.fetchone()
+        if not row:
+            return None, {}
+
+        experiment = dict(row)
+        experiment['config'] = json.loads(experiment['config'])
+
+        stats = {
+            'participant_count': experiment.pop('participant_count'),
+            'session_count': experiment.pop('session_count'),
+            'completed_sessions': experiment.pop('completed_sessions'),
+            'task_statistics': self._get_experiment_task_statistics(experiment_id)
+        }
+
+        return experiment, stats
+
+    def _get_experiment_task_statistics(self, experiment_id: int) -> Dict:
+        """Get trial statistics by task for an experiment."""
         self.cursor.execute("""
             SELECT t.task_name,
                    COUNT(*) as trial_count,
@@ -426,9 +579,7 @@ class DatabaseManager:
         for row in self.cursor.fetchall():
             task_stats[row['task_name']] = dict(row)
 
-        stats['task_statistics'] = task_stats
-
-        return stats
+        return task_stats
 
     # --- Session Management ---
 
@@ -494,6 +645,13 @@ class DatabaseManager:
 
         return sessions
 
+    def get_participant_session_count(self, participant_id: int) -> int:
+        """Get the number of sessions a participant has, without loading them."""
+        self.cursor.execute("""
+            SELECT COUNT(*) FROM sessions WHERE participant_id = ?
+        """, (participant_id,))
+        return self.cursor.fetchone()[0]
+
     def complete_session(self, session_id: int):
         """Mark a session as completed."""
         self.cursor.execute("""
@@ -568,6 +726,10 @@ class DatabaseManager:
         self.cursor.execute("SELECT COUNT(*) FROM participants")
         stats['total_participants'] = self.cursor.fetchone()[0]
 
+        # Participants with at least one session
+        self.cursor.execute("SELECT COUNT(DISTINCT participant_id) FROM sessions")
+        stats['active_participants'] = self.cursor.fetchone()[0]
+
         # Active sessions
         self.cursor.execute("SELECT COUNT(*) FROM sessions WHERE completed = 0")
         stats['active_sessions'] = self.cursor.fetchone()[0]
@@ -679,6 +841,8 @@ class DatabaseManager:
         """Close the database connection."""
         if self.connection:
             self.connection.close()
+            self.connection = None
+            self.cursor = None
             logger.info("Database connection closed")
 
     def __del__(self):
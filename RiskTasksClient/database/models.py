@@ -4,6 +4,7 @@ Defines the structure and validation for database entities.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Optional, Dict
 from enum import Enum
@@ -28,13 +29,30 @@ class TaskType(Enum):
     @classmethod
     def get_display_name(cls, task_type):
         """Get human-readable display name for task type."""
-        display_names = {
-            cls.BART: "Balloon Task (BART)",
-            cls.ICE_FISHING: "Ice Fishing",
-            cls.MOUNTAIN_MINING: "Mountain Mining",
-            cls.SPINNING_BOTTLE: "Spinning Bottle"
-        }
-        return display_names.get(task_type, task_type.value)
+        return _TASK_DISPLAY_NAMES.get(task_type, task_type.value)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def display_name_of(cls, value: str) -> str:
+        """Get the display name for a task type value such as 'bart' (cached)."""
+        return cls.get_display_name(cls(value))
+
+
+# Display names per task type, built once (an Enum body can't hold a plain dict)
+_TASK_DISPLAY_NAMES = {
+    TaskType.BART: "Balloon Task (BART)",
+    TaskType.ICE_FISHING: "Ice Fishing",
+    TaskType.MOUNTAIN_MINING: "Mountain Mining",
+    TaskType.SPINNING_BOTTLE: "Spinning Bottle"
+}
+
+# Script under tasks/ that runs each task type, keyed by task type value
+TASK_SCRIPTS = {
+    "bart": "bart_task.py",
+    "ice_fishing": "ice_task.py",
+    "mountain_mining": "mining_task.py",
+    "spinning_bottle": "stb_task.py"
+}
 
 
 class TrialOutcome(Enum):
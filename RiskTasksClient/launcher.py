@@ -12,6 +12,8 @@ from tkinter import messagebox
 import customtkinter as ctk
 import subprocess
 
+from utils.fonts import get_font
+
 # Set CustomTkinter appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -25,17 +27,18 @@ class RiskTasksLauncher(ctk.CTk):
 
         # Window setup
         self.title("Risk Tasks Study")
-        self.geometry("600x400")
+        width, height = 600, 400
+        self.geometry(f"{width}x{height}")
         self.resizable(False, False)
 
-        # Center window
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # Center window; the size is fixed, so no layout pass is needed to measure it
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
 
+        # Password dialog, built on first use and withdrawn between uses
+        self._password_dialog = None
+
         # Setup UI
         self.setup_ui()
 
@@ -45,14 +48,14 @@ class RiskTasksLauncher(ctk.CTk):
         title_label = ctk.CTkLabel(
             self,
             text="Risk Assessment Study",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=get_font(32, "bold")
         )
         title_label.pack(pady=(40, 20))
 
         subtitle_label = ctk.CTkLabel(
             self,
             text="Please select your role:",
-            font=ctk.CTkFont(size=18)
+            font=get_font(18)
         )
         subtitle_label.pack(pady=(0, 40))
 
@@ -67,7 +70,7 @@ class RiskTasksLauncher(ctk.CTk):
             command=self.launch_participant,
             width=200,
             height=80,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=get_font(20, "bold"),
             fg_color="#1f6aa5",
             hover_color="#144870"
         )
@@ -76,7 +79,7 @@ class RiskTasksLauncher(ctk.CTk):
         participant_info = ctk.CTkLabel(
             buttons_frame,
             text="Start or continue\nyour session",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color="gray"
         )
         participant_info.grid(row=1, column=0, padx=20, pady=(0, 20))
@@ -88,7 +91,7 @@ class RiskTasksLauncher(ctk.CTk):
             command=self.launch_researcher,
             width=200,
             height=80,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=get_font(20, "bold"),
             fg_color="#2d572c",
             hover_color="#1e3a1e"
         )
@@ -97,7 +100,7 @@ class RiskTasksLauncher(ctk.CTk):
         researcher_info = ctk.CTkLabel(
             buttons_frame,
             text="Access study\nmanagement",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color="gray"
         )
         researcher_info.grid(row=1, column=1, padx=20, pady=(0, 20))
@@ -125,29 +128,47 @@ class RiskTasksLauncher(ctk.CTk):
 
     def launch_researcher(self):
         """Launch the researcher interface with password protection."""
-        # Create password dialog
+        if self._password_dialog is None:
+            self._password_dialog = self.create_password_dialog()
+        dialog, password_entry = self._password_dialog
+
+        # Start each attempt from an empty field
+        password_entry.delete(0, tk.END)
+
+        dialog.deiconify()
+        dialog.grab_set()
+        password_entry.focus()
+
+    def hide_password_dialog(self):
+        """Close the password dialog, keeping it for the next attempt."""
+        dialog, _ = self._password_dialog
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def create_password_dialog(self):
+        """Build the researcher password dialog; returns (dialog, entry)."""
         dialog = ctk.CTkToplevel(self)
         dialog.title("Researcher Access")
         dialog.geometry("400x200")
         dialog.resizable(False, False)
 
         # Center dialog
-        dialog.update_idletasks()
         x = (dialog.winfo_screenwidth() // 2) - (200)
         y = (dialog.winfo_screenheight() // 2) - (100)
         dialog.geometry(f'400x200+{x}+{y}')
 
         # Make dialog modal
         dialog.transient(self)
-        dialog.grab_set()
 
+        # The dialog is fixed at 400x200, so its three rows are placed at fixed
+        # offsets, centred horizontally, instead of going through the packer
         # Password prompt
         prompt_label = ctk.CTkLabel(
             dialog,
             text="Enter researcher password:",
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
-        prompt_label.pack(pady=(30, 10))
+        prompt_label.place(relx=0.5, y=30, anchor="n")
 
         password_var = tk.StringVar()
         password_entry = ctk.CTkEntry(
@@ -155,14 +176,13 @@ class RiskTasksLauncher(ctk.CTk):
             textvariable=password_var,
             show="*",
             width=250,
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
-        password_entry.pack(pady=10)
-        password_entry.focus()
+        password_entry.place(relx=0.5, y=78, anchor="n")
 
         def check_password(event=None):
             if password_var.get() == "PIZZA":
-                dialog.destroy()
+                self.hide_password_dialog()
                 self.withdraw()  # Hide launcher
 
                 # Launch the researcher interface (existing main.py)
@@ -182,7 +202,7 @@ class RiskTasksLauncher(ctk.CTk):
 
         # Buttons
         button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        button_frame.pack(pady=20)
+        button_frame.place(relx=0.5, y=136, anchor="n")
 
         ok_btn = ctk.CTkButton(
             button_frame,
@@ -195,7 +215,7 @@ class RiskTasksLauncher(ctk.CTk):
         cancel_btn = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            command=dialog.destroy,
+            command=self.hide_password_dialog,
             width=100,
             fg_color="gray"
         )
@@ -203,11 +223,13 @@ class RiskTasksLauncher(ctk.CTk):
 
         # Handle dialog close
         def on_close():
-            dialog.destroy()
+            self.hide_password_dialog()
             self.deiconify()  # Show launcher again
 
         dialog.protocol("WM_DELETE_WINDOW", on_close)
 
+        return dialog, password_entry
+
 
 def main():
     """Main entry point for the application."""
@@ -8,6 +8,7 @@ between different risk assessment paradigms.
 import sys
 import os
 import json
+from functools import partial
 from pathlib import Path
 from datetime import datetime, timedelta
 import tkinter as tk
@@ -28,6 +29,7 @@ from ui.data_viewer import DataViewer
 from ui.experiment_builder import ExperimentBuilder
 from utils.task_scheduler import TaskScheduler
 from utils.backup_manager import BackupManager
+from utils.fonts import get_font
 
 
 class RiskTasksClient(ctk.CTk):
@@ -128,6 +130,7 @@ class RiskTasksClient(ctk.CTk):
 
         # Create pages
         self.pages = {}
+        self.current_page = None
         self.create_pages()
 
         # Show dashboard by default
@@ -143,7 +146,7 @@ class RiskTasksClient(ctk.CTk):
         title_label = ctk.CTkLabel(
             self.sidebar,
             text="Risk Tasks\nClient",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=20)
 
@@ -161,7 +164,7 @@ class RiskTasksClient(ctk.CTk):
             btn = ctk.CTkButton(
                 self.sidebar,
                 text=f"{icon} {text}",
-                command=lambda p=page_name: self.show_page(p),
+                command=partial(self.show_page, page_name),
                 width=180,
                 height=40
             )
@@ -180,40 +183,15 @@ class RiskTasksClient(ctk.CTk):
         exit_btn.pack(side="bottom", pady=20)
 
     def create_pages(self):
-        """Create all application pages."""
-        # Dashboard page
-        self.pages["dashboard"] = self.create_dashboard_page()
-
-        # Experiments page
-        self.pages["experiments"] = ExperimentBuilder(
-            self.content_frame,
-            self.db_manager
-        )
-
-        # Participants page
-        self.pages["participants"] = ParticipantManager(
-            self.content_frame,
-            self.db_manager
-        )
-
-        # Sessions page
-        self.pages["sessions"] = SessionMonitor(
-            self.content_frame,
-            self.db_manager
-        )
-
-        # Data analysis page
-        self.pages["data"] = DataViewer(
-            self.content_frame,
-            self.db_manager
-        )
-
-        # Settings page
-        self.pages["settings"] = SettingsPanel(
-            self.content_frame,
-            self.config,
-            self.save_config
-        )
+        """Register the application pages; each is built on first visit."""
+        self.page_factories = {
+            "dashboard": self.create_dashboard_page,
+            "experiments": partial(ExperimentBuilder, self.content_frame, self.db_manager),
+            "participants": partial(ParticipantManager, self.content_frame, self.db_manager),
+            "sessions": partial(SessionMonitor, self.content_frame, self.db_manager),
+            "data": partial(DataViewer, self.content_frame, self.db_manager),
+            "settings": partial(SettingsPanel, self.content_frame, self.config, self.save_config),
+        }
 
     def create_dashboard_page(self):
         """Create the dashboard page."""
@@ -223,7 +201,7 @@ class RiskTasksClient(ctk.CTk):
         title = ctk.CTkLabel(
             dashboard,
             text="Dashboard",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=get_font(32, "bold")
         )
         title.pack(pady=20)
 
@@ -247,13 +225,13 @@ class RiskTasksClient(ctk.CTk):
             card.grid(row=0, column=i, padx=10, pady=10, sticky="nsew")
             stats_frame.columnconfigure(i, weight=1)
 
-            icon_label = ctk.CTkLabel(card, text=icon, font=ctk.CTkFont(size=40))
+            icon_label = ctk.CTkLabel(card, text=icon, font=get_font(40))
             icon_label.pack(pady=10)
 
             value_label = ctk.CTkLabel(
                 card,
                 text=str(value),
-                font=ctk.CTkFont(size=36, weight="bold")
+                font=get_font(36, "bold")
             )
             value_label.pack()
 
@@ -267,7 +245,7 @@ class RiskTasksClient(ctk.CTk):
         exp_title = ctk.CTkLabel(
             exp_frame,
             text="Active Experiments",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         exp_title.pack(pady=10)
 
@@ -310,7 +288,7 @@ class RiskTasksClient(ctk.CTk):
         actions_title = ctk.CTkLabel(
             actions_frame,
             text="Quick Actions",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         actions_title.pack(pady=10)
 
@@ -321,7 +299,7 @@ class RiskTasksClient(ctk.CTk):
         new_exp_btn = ctk.CTkButton(
             actions_row,
             text="🧪 New Experiment",
-            command=lambda: self.show_page("experiments"),
+            command=partial(self.show_page, "experiments"),
             width=200,
             height=50
         )
@@ -330,7 +308,7 @@ class RiskTasksClient(ctk.CTk):
         new_participant_btn = ctk.CTkButton(
             actions_row,
             text="➕ New Participant",
-            command=lambda: self.show_page("participants"),
+            command=partial(self.show_page, "participants"),
             width=200,
             height=50
         )
@@ -339,7 +317,7 @@ class RiskTasksClient(ctk.CTk):
         view_data_btn = ctk.CTkButton(
             actions_row,
             text="📈 View Data",
-            command=lambda: self.show_page("data"),
+            command=partial(self.show_page, "data"),
             width=200,
             height=50
         )
@@ -352,7 +330,7 @@ class RiskTasksClient(ctk.CTk):
         activity_title = ctk.CTkLabel(
             activity_frame,
             text="Recent Activity",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         activity_title.pack(pady=10)
 
@@ -371,13 +349,19 @@ class RiskTasksClient(ctk.CTk):
 
     def show_page(self, page_name):
         """Show the specified page."""
-        # Hide all pages
-        for page in self.pages.values():
-            page.pack_forget()
+        # Hide the page currently shown, if any
+        current = self.pages.get(self.current_page)
+        if current is not None:
+            current.pack_forget()
+
+        # Build the page the first time it is requested
+        if page_name not in self.pages and page_name in self.page_factories:
+            self.pages[page_name] = self.page_factories.pop(page_name)()
 
         # Show selected page
         if page_name in self.pages:
             self.pages[page_name].pack(fill="both", expand=True)
+            self.current_page = page_name
 
             # Refresh page if it has a refresh method
             if hasattr(self.pages[page_name], 'refresh'):
@@ -11,12 +11,16 @@ from datetime import datetime, timedelta
 import subprocess
 import sys
 import os
+import random
 from pathlib import Path
 import json
-from typing import Tuple, List
+from collections import Counter
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from database.db_manager import DatabaseManager
-from database.models import Participant, Session, TaskType, Gender
+from database.models import Participant, Session, TaskType, Gender, TASK_SCRIPTS
+from utils.fonts import get_font
 from utils.task_scheduler import TaskScheduler
 
 
@@ -35,15 +39,17 @@ class ParticipantInterface(ctk.CTk):
         self.current_session_id = None
         self.current_experiment = None
 
+        # Active experiments found by code on the registration screen; misses and
+        # inactive experiments are not kept, so one created or activated later is seen
+        self._experiment_lookup_cache: Dict[str, Dict] = {}
+
         # Window setup
         self.title("Risk Tasks - Participant")
-        self.geometry("900x700")
+        width, height = 900, 700
+        self.geometry(f"{width}x{height}")
         self.resizable(False, False)
 
-        # Center window
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # Center window; the size is fixed, so no layout pass is needed to measure it
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
@@ -56,24 +62,38 @@ class ParticipantInterface(ctk.CTk):
 
     def setup_ui(self):
         """Setup the participant interface."""
-        # Create main container
-        self.main_container = ctk.CTkFrame(self)
-        self.main_container.pack(fill="both", expand=True, padx=20, pady=20)
+        # Main container, created by reset_container() for each screen
+        self.main_container = None
+
+        # (session id, tasks) of the session screen currently shown, so a
+        # refresh can update it in place instead of rebuilding it
+        self._session_screen_key = None
 
         # Show login screen initially
         self.show_login_screen()
 
+    def reset_container(self):
+        """Swap in an empty main container for the next screen.
+
+        Destroying the old frame tears the previous screen down in one call
+        rather than one destroy() per child.
+        """
+        if self.main_container is not None:
+            self.main_container.destroy()
+        self._session_screen_key = None
+        self.main_container = ctk.CTkFrame(self)
+        self.main_container.pack(fill="both", expand=True, padx=20, pady=20)
+
     def show_login_screen(self):
         """Show the initial login/registration screen."""
         # Clear container
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
+        self.reset_container()
 
         # Title
         title_label = ctk.CTkLabel(
             self.main_container,
             text="Welcome to the Risk Assessment Study",
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=get_font(28, "bold")
         )
         title_label.pack(pady=(30, 40))
 
@@ -88,7 +108,7 @@ class ParticipantInterface(ctk.CTk):
         new_label = ctk.CTkLabel(
             new_frame,
             text="New Participant",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         new_label.pack(pady=(20, 15))
 
@@ -98,7 +118,7 @@ class ParticipantInterface(ctk.CTk):
             command=self.show_registration_screen,
             width=200,
             height=50,
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         new_btn.pack(pady=(0, 20))
 
@@ -113,14 +133,14 @@ class ParticipantInterface(ctk.CTk):
         returning_label = ctk.CTkLabel(
             returning_frame,
             text="Returning Participant",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         returning_label.pack(pady=(20, 15))
 
         code_label = ctk.CTkLabel(
             returning_frame,
             text="Enter your participant code:",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         code_label.pack(pady=(0, 5))
 
@@ -128,7 +148,7 @@ class ParticipantInterface(ctk.CTk):
         self.code_entry = ctk.CTkEntry(
             returning_frame,
             width=200,
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             placeholder_text="e.g., P001"
         )
         self.code_entry.pack(pady=5)
@@ -144,7 +164,7 @@ class ParticipantInterface(ctk.CTk):
             command=self.login_returning_participant,
             width=200,
             height=50,
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         continue_btn.pack(pady=(10, 20))
 
@@ -161,15 +181,16 @@ class ParticipantInterface(ctk.CTk):
 
     def show_registration_screen(self):
         """Show registration screen for new participants."""
+        self._experiment_lookup_cache.clear()
+
         # Clear container
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
+        self.reset_container()
 
         # Title
         title_label = ctk.CTkLabel(
             self.main_container,
             text="New Participant Registration",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=(30, 40))
 
@@ -181,14 +202,14 @@ class ParticipantInterface(ctk.CTk):
         exp_code_label = ctk.CTkLabel(
             form_frame,
             text="Experiment Code:",
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         exp_code_label.grid(row=0, column=0, sticky="e", padx=(20, 10), pady=10)
 
         self.exp_code_entry = ctk.CTkEntry(
             form_frame,
             width=200,
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             placeholder_text="Enter experiment code"
         )
         self.exp_code_entry.grid(row=0, column=1, padx=(0, 20), pady=10)
@@ -197,14 +218,14 @@ class ParticipantInterface(ctk.CTk):
         age_label = ctk.CTkLabel(
             form_frame,
             text="Age:",
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         age_label.grid(row=1, column=0, sticky="e", padx=(20, 10), pady=10)
 
         self.age_entry = ctk.CTkEntry(
             form_frame,
             width=200,
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             placeholder_text="Enter your age"
         )
         self.age_entry.grid(row=1, column=1, padx=(0, 20), pady=10)
@@ -213,7 +234,7 @@ class ParticipantInterface(ctk.CTk):
         gender_label = ctk.CTkLabel(
             form_frame,
             text="Gender:",
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         gender_label.grid(row=2, column=0, sticky="e", padx=(20, 10), pady=10)
 
@@ -221,7 +242,7 @@ class ParticipantInterface(ctk.CTk):
             form_frame,
             values=["Male", "Female", "Other", "Prefer not to say"],
             width=200,
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         self.gender_menu.set("Prefer not to say")
         self.gender_menu.grid(row=2, column=1, padx=(0, 20), pady=10)
@@ -236,7 +257,7 @@ class ParticipantInterface(ctk.CTk):
             command=self.register_new_participant,
             width=150,
             height=50,
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         register_btn.pack(side="left", padx=10)
 
@@ -246,7 +267,7 @@ class ParticipantInterface(ctk.CTk):
             command=self.show_login_screen,
             width=150,
             height=50,
-            font=ctk.CTkFont(size=16),
+            font=get_font(16),
             fg_color="gray"
         )
         back_btn.pack(side="left", padx=10)
@@ -260,7 +281,7 @@ class ParticipantInterface(ctk.CTk):
             return
 
         # Verify experiment exists and is active
-        experiment = self.db_manager.get_experiment(experiment_code=exp_code)
+        experiment = self.lookup_experiment(exp_code)
         if not experiment:
             messagebox.showerror("Error", "Invalid experiment code")
             return
@@ -325,6 +346,7 @@ class ParticipantInterface(ctk.CTk):
 
             self.current_participant_id = participant_id
             self.current_experiment = experiment
+            self._experiment_lookup_cache.clear()
 
             # Show participant code
             messagebox.showinfo(
@@ -340,17 +362,19 @@ class ParticipantInterface(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Error", f"Registration failed: {e}")
 
+    def lookup_experiment(self, exp_code: str) -> Optional[Dict]:
+        """Get an experiment by code, remembering it while on the registration screen."""
+        experiment = self._experiment_lookup_cache.get(exp_code)
+        if experiment is None:
+            experiment = self.db_manager.get_experiment(experiment_code=exp_code)
+            if experiment and experiment['is_active']:
+                self._experiment_lookup_cache[exp_code] = experiment
+        return experiment
+
     def generate_participant_code(self):
         """Generate a unique participant code."""
-        participants = self.db_manager.get_all_participants()
-
-        # Find the highest participant number
-        max_num = 0
-        for p in participants:
-            code = p['participant_code']
-            if code.startswith('P') and code[1:].isdigit():
-                num = int(code[1:])
-                max_num = max(max_num, num)
+        # Highest existing participant number, computed by the database
+        max_num = self.db_manager.get_max_participant_number()
 
         # Generate next code
         next_num = max_num + 1
@@ -569,7 +593,6 @@ class ParticipantInterface(ctk.CTk):
 
         # Select instances
         if len(available_instances) >= tasks_per_session:
-            import random
             selected_instances = random.sample(available_instances, tasks_per_session)
         else:
             # This shouldn't happen with proper validation
@@ -611,18 +634,14 @@ class ParticipantInterface(ctk.CTk):
             available_tasks = [t for t in enabled_tasks if t not in assigned_tasks]
 
             if len(available_tasks) >= tasks_per_session:
-                import random
                 return random.sample(available_tasks, tasks_per_session)
             else:
                 # Use all available and fill from assigned if needed
-                import random
-                selected = available_tasks.copy()
-                if len(selected) < tasks_per_session:
-                    already_assigned = list(assigned_tasks)
-                    random.shuffle(already_assigned)
-                    needed = tasks_per_session - len(selected)
-                    selected.extend(already_assigned[:needed])
-                return selected
+                already_assigned = list(assigned_tasks)
+                random.shuffle(already_assigned)
+                needed = tasks_per_session - len(available_tasks)
+                available_tasks.extend(already_assigned[:needed])
+                return available_tasks
 
         return []
 
@@ -678,9 +697,37 @@ class ParticipantInterface(ctk.CTk):
 
     def show_session_screen(self, tasks):
         """Show the session screen with experiment info."""
+        # Get completed tasks
+        trials = self.db_manager.get_session_trials(self.current_session_id)
+        completed_tasks = set()
+
+        # Get required trials from experiment config
+        exp_config = self.current_experiment['config'].get('experiment', {})
+        required_trials = exp_config.get('total_trials_per_task', 30)
+
+        # Count trials per task in one pass instead of filtering once per task
+        trial_counts = Counter(t['task_name'] for t in trials)
+        for task in tasks:
+            if trial_counts[task] >= required_trials:
+                completed_tasks.add(task)
+
+        # Returning to the screen already shown for this session only needs
+        # the newly completed tasks marked; the finished screen differs, so
+        # it is still built from scratch
+        key = (self.current_session_id, tuple(tasks))
+        if key == self._session_screen_key and len(completed_tasks) < len(tasks):
+            for task, btn, display_name in zip(tasks, self.task_buttons, self._task_button_names):
+                if task in completed_tasks:
+                    btn.configure(
+                        text=f"✓ {display_name}",
+                        state="disabled",
+                        fg_color="gray"
+                    )
+            self.progress_label.configure(text=f"Completed: {len(completed_tasks)}/{len(tasks)} tasks")
+            return
+
         # Clear container
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
+        self.reset_container()
 
         # Get participant info
         participant = self.db_manager.get_participant(participant_id=self.current_participant_id)
@@ -689,7 +736,7 @@ class ParticipantInterface(ctk.CTk):
         title_label = ctk.CTkLabel(
             self.main_container,
             text=f"Welcome, {participant['participant_code']}",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=(30, 10))
 
@@ -697,7 +744,7 @@ class ParticipantInterface(ctk.CTk):
         exp_label = ctk.CTkLabel(
             self.main_container,
             text=f"Study: {self.current_experiment['name']}",
-            font=ctk.CTkFont(size=16),
+            font=get_font(16),
             text_color="gray"
         )
         exp_label.pack(pady=(0, 10))
@@ -709,7 +756,7 @@ class ParticipantInterface(ctk.CTk):
         session_label = ctk.CTkLabel(
             self.main_container,
             text=f"Session {current_session['session_number']}",
-            font=ctk.CTkFont(size=18)
+            font=get_font(18)
         )
         session_label.pack(pady=(0, 30))
 
@@ -717,7 +764,7 @@ class ParticipantInterface(ctk.CTk):
         instructions_label = ctk.CTkLabel(
             self.main_container,
             text="Please complete the following tasks:",
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         instructions_label.pack(pady=(0, 20))
 
@@ -725,34 +772,22 @@ class ParticipantInterface(ctk.CTk):
         tasks_frame = ctk.CTkFrame(self.main_container)
         tasks_frame.pack(expand=True, pady=20)
 
-        # Get completed tasks
-        trials = self.db_manager.get_session_trials(self.current_session_id)
-        completed_tasks = set()
-
-        # Get required trials from experiment config
-        exp_config = self.current_experiment['config'].get('experiment', {})
-        required_trials = exp_config.get('total_trials_per_task', 30)
-
-        for task in tasks:
-            task_trials = [t for t in trials if t['task_name'] == task]
-            if len(task_trials) >= required_trials:
-                completed_tasks.add(task)
-
         # Get task instance assignments for this session
         instance_ids = self.get_task_instance_assignment(self.current_session_id)
 
-        # Create task buttons
-        self.task_buttons = {}
-        for i, task in enumerate(tasks):
-            display_name = TaskType.get_display_name(TaskType(task))
+        task_instances = self.current_experiment['config'].get('task_instances', {})
 
-            # If we have instance assignments, get the specific instance for this task
+        # Create task buttons, kept in task order since a task type can repeat
+        self.task_buttons = []
+        self._task_button_names = []
+        for i, task in enumerate(tasks):
+            # Prefer the assigned instance's own name, if it has one
+            instance = None
             if instance_ids and i < len(instance_ids):
-                instance_id = instance_ids[i]
-                task_instances = self.current_experiment['config'].get('task_instances', {})
-                if instance_id in task_instances:
-                    instance_display = task_instances[instance_id].get('display_name', display_name)
-                    display_name = instance_display
+                instance = task_instances.get(instance_ids[i])
+            display_name = instance.get('display_name') if instance else None
+            if display_name is None:
+                display_name = TaskType.display_name_of(task)
 
             if task in completed_tasks:
                 button_text = f"✓ {display_name}"
@@ -766,24 +801,25 @@ class ParticipantInterface(ctk.CTk):
             btn = ctk.CTkButton(
                 tasks_frame,
                 text=button_text,
-                command=lambda t=task, idx=i: self.launch_task_with_instance(t, idx),
+                command=partial(self.launch_task_with_instance, task, i),
                 state=button_state,
                 fg_color=button_color,
                 width=250,
                 height=80,
-                font=ctk.CTkFont(size=18)
+                font=get_font(18)
             )
             btn.grid(row=i, column=0, padx=20, pady=10)
-            self.task_buttons[task] = btn
+            self.task_buttons.append(btn)
+            self._task_button_names.append(display_name)
 
         # Progress info
-        progress_label = ctk.CTkLabel(
+        self.progress_label = ctk.CTkLabel(
             self.main_container,
             text=f"Completed: {len(completed_tasks)}/{len(tasks)} tasks",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color="gray"
         )
-        progress_label.pack(pady=10)
+        self.progress_label.pack(pady=10)
 
         # Check if session is complete
         if len(completed_tasks) == len(tasks):
@@ -791,7 +827,7 @@ class ParticipantInterface(ctk.CTk):
             complete_label = ctk.CTkLabel(
                 self.main_container,
                 text="Session Complete! Thank you!",
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=get_font(16, "bold"),
                 text_color="green"
             )
             complete_label.pack(pady=10)
@@ -826,11 +862,13 @@ class ParticipantInterface(ctk.CTk):
             )
             return_btn.pack(pady=10)
         else:
+            self._session_screen_key = key
+
             # Refresh button
             refresh_btn = ctk.CTkButton(
                 self.main_container,
                 text="🔄 Refresh",
-                command=lambda: self.show_session_screen(tasks),
+                command=partial(self.show_session_screen, tasks),
                 width=120,
                 height=40,
                 fg_color="orange"
@@ -861,20 +899,12 @@ class ParticipantInterface(ctk.CTk):
 
     def launch_task(self, task_name: str, instance_id: str = None):
         """Launch the specified task with experiment config."""
-        # Map task names to their Python files
-        task_files = {
-            "bart": "bart_task.py",
-            "ice_fishing": "ice_task.py",
-            "mountain_mining": "mining_task.py",
-            "spinning_bottle": "stb_task.py"
-        }
-
-        if task_name not in task_files:
+        if task_name not in TASK_SCRIPTS:
             messagebox.showerror("Error", f"Unknown task: {task_name}")
             return
 
         # Get task file path
-        task_file = Path("tasks") / task_files[task_name]
+        task_file = Path("tasks") / TASK_SCRIPTS[task_name]
 
         if not task_file.exists():
             messagebox.showerror(
@@ -931,7 +961,7 @@ class ParticipantInterface(ctk.CTk):
 
             # Save the config file
             with open(temp_config_path, 'w') as f:
-                json.dump(config_to_save, f, indent=2)
+                json.dump(config_to_save, f, separators=(',', ':'))
 
             print(f"Saved config to: {temp_config_path}")
             print(f"Task config content: {json.dumps(config_to_save.get('tasks', {}).get(task_name, {}), indent=2)}")
@@ -962,7 +992,7 @@ class ParticipantInterface(ctk.CTk):
 
         # Launch the task
         try:
-            display_name = TaskType.get_display_name(TaskType(task_name))
+            display_name = TaskType.display_name_of(task_name)
             messagebox.showinfo(
                 "Launching Task",
                 f"Starting {display_name}...\n"
@@ -0,0 +1,22 @@
+"""
+Shared test setup for Risk Tasks Client.
+Puts the client package root on the import path and provides a scratch database.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """An initialized DatabaseManager backed by a temporary database file."""
+    manager = DatabaseManager(str(tmp_path / "participants.db"))
+    manager.initialize()
+    yield manager
+    manager.close()
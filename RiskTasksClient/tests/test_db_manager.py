@@ -0,0 +1,66 @@
+"""
+Tests for DatabaseManager experiment operations.
+"""
+
+import pytest
+
+from database.db_manager import DatabaseManager
+
+
+def _next_code(existing):
+    """Code generator that picks the first free EXP<n>A code."""
+    n = 1
+    while f"EXP{n}A" in existing:
+        n += 1
+    return f"EXP{n}A"
+
+
+def test_duplicate_after_code_clash(db_manager):
+    experiment_id = db_manager.create_experiment("EXP1A", "Pilot", {'experiment': {}})
+
+    with pytest.raises(ValueError):
+        db_manager.create_experiment("EXP1A", "Clash", {'experiment': {}})
+
+    new_id, new_code = db_manager.duplicate_experiment(experiment_id, _next_code)
+
+    assert new_code == "EXP2A"
+    assert db_manager.get_experiment(experiment_id=new_id)['name'] == "Pilot (Copy)"
+
+
+def test_duplicate_with_open_transaction(db_manager):
+    experiment_id = db_manager.create_experiment("EXP1A", "Pilot", {'experiment': {}})
+
+    # Leave an implicit transaction open, as a failed write would
+    db_manager.cursor.execute("UPDATE experiments SET name = name WHERE id = ?", (experiment_id,))
+    assert db_manager.connection.in_transaction
+
+    result = db_manager.duplicate_experiment(experiment_id, _next_code)
+
+    assert result is not None
+    assert not db_manager.connection.in_transaction
+
+
+def test_duplicate_missing_experiment(db_manager):
+    assert db_manager.duplicate_experiment(999, _next_code) is None
+    assert not db_manager.connection.in_transaction
+
+
+def test_existing_experiment_codes_include_inactive(db_manager):
+    db_manager.create_experiment("EXP1A", "Pilot", {'experiment': {}})
+    inactive_id = db_manager.create_experiment("EXP2B", "Old", {'experiment': {}})
+    db_manager.update_experiment(inactive_id, is_active=False)
+
+    assert db_manager.get_existing_experiment_codes() == {"EXP1A", "EXP2B"}
+
+
+def test_experiments_version_sees_other_connections(db_manager):
+    version = db_manager.experiments_version
+
+    other = DatabaseManager(str(db_manager.db_path))
+    other.connect()
+    try:
+        other.create_experiment("EXP1A", "Pilot", {'experiment': {}})
+    finally:
+        other.close()
+
+    assert db_manager.experiments_version != version
@@ -0,0 +1,134 @@
+"""
+Tests for the experiment list actions in the Experiment Builder.
+The builder is exercised without a window: widget collaborators are replaced
+by small fakes while the database is real.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from ui import experiment_builder
+from ui.experiment_builder import ExperimentBuilder, _parse_form_date
+
+
+class FakeTree:
+    """Minimal stand-in for the experiment list Treeview with one selected row."""
+
+    def __init__(self, experiment_id):
+        self.experiment_id = experiment_id
+
+    def selection(self):
+        return ("row",)
+
+    def item(self, iid):
+        return {'tags': [self.experiment_id]}
+
+
+class FakeNotebook:
+    """Records which tab was selected."""
+
+    def __init__(self):
+        self.selected = None
+
+    def select(self, index):
+        self.selected = index
+
+
+@pytest.fixture
+def builder(db_manager, monkeypatch):
+    """An ExperimentBuilder with a selected experiment and no Tk widgets."""
+    experiment_id = db_manager.create_experiment(
+        experiment_code="EXP100A",
+        name="Pilot",
+        config={'experiment': {}}
+    )
+
+    builder = ExperimentBuilder.__new__(ExperimentBuilder)
+    builder.db_manager = db_manager
+    builder._experiment_cache = {}
+    builder.current_experiment_id = None
+    builder.exp_tree = FakeTree(experiment_id)
+    builder.notebook = FakeNotebook()
+    builder.loaded = []
+    builder.refreshes = 0
+    builder.ensure_tab_built = lambda index: None
+    builder.load_experiment_to_form = builder.loaded.append
+
+    def schedule_refresh():
+        builder.refreshes += 1
+    builder.schedule_refresh = schedule_refresh
+
+    monkeypatch.setattr(experiment_builder.messagebox, "showinfo", lambda *args, **kwargs: None)
+    monkeypatch.setattr(experiment_builder.messagebox, "showerror", lambda *args, **kwargs: None)
+    return builder
+
+
+def test_edit_experiment_loads_selected_experiment(builder):
+    experiment_id = builder.exp_tree.experiment_id
+
+    builder.edit_experiment()
+
+    assert builder.current_experiment_id == experiment_id
+    assert [e['experiment_code'] for e in builder.loaded] == ["EXP100A"]
+    assert builder.notebook.selected == 1
+
+
+def test_toggle_active_flips_status(builder, db_manager):
+    experiment_id = builder.exp_tree.experiment_id
+
+    builder.toggle_active()
+    assert not db_manager.get_experiment(experiment_id=experiment_id)['is_active']
+
+    # The write bumps experiments_version, so the cached row is not reused
+    builder.toggle_active()
+    assert db_manager.get_experiment(experiment_id=experiment_id)['is_active']
+    assert builder.refreshes == 2
+
+
+def test_parse_form_date_accepts_yyyy_mm_dd():
+    assert _parse_form_date("2024-01-05") == datetime(2024, 1, 5)
+
+
+@pytest.mark.parametrize("text", ["2024-1-5", "20240105", "2024-W01-1", "2024-01-05T10:00", "2024-02-30"])
+def test_parse_form_date_rejects_other_layouts(text):
+    with pytest.raises(ValueError):
+        _parse_form_date(text)
+
+
+def test_destroy_cancels_polls_and_is_idempotent(db_manager, monkeypatch):
+    builder = ExperimentBuilder.__new__(ExperimentBuilder)
+    builder.db_manager = db_manager
+    builder._db_pool = ThreadPoolExecutor(max_workers=1)
+    builder._worker_db_manager = None
+    builder._db_poll_jobs = {}
+    builder._destroyed = False
+    builder._refresh_after_id = None
+    cancelled = []
+    builder.after = lambda ms, *args: "after#1"
+    builder.after_cancel = cancelled.append
+    monkeypatch.setattr(experiment_builder.ctk.CTkFrame, "destroy", lambda self: None, raising=False)
+
+    # Hold the worker so the query is still pending when the builder goes away
+    gate = threading.Event()
+    builder._db_pool.submit(gate.wait)
+    results = []
+    builder._run_db_query(results.append, 'get_active_experiments')
+
+    builder.destroy()
+    builder.destroy()
+    gate.set()
+    builder._db_pool.shutdown(wait=True)
+
+    assert cancelled == ["after#1"]
+    assert builder._db_poll_jobs == {}
+
+    # A poll that was already running when the builder was destroyed does nothing
+    future = Future()
+    future.set_result([])
+    builder._poll_db_query(future, results.append)
+    assert results == []
@@ -21,6 +21,7 @@ import seaborn as sns
 
 from database.db_manager import DatabaseManager
 from database.models import TaskType
+from utils.fonts import get_font
 
 # Set matplotlib style
 plt.style.use('seaborn-v0_8-darkgrid')
@@ -52,7 +53,7 @@ class DataViewer(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Data Analysis",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=20)
 
@@ -86,7 +87,7 @@ class DataViewer(ctk.CTkFrame):
         filter_label = ctk.CTkLabel(
             parent,
             text="Filters",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         filter_label.pack(pady=10)
 
@@ -157,7 +158,7 @@ class DataViewer(ctk.CTkFrame):
         task_label = ctk.CTkLabel(
             task_frame,
             text="Select Tasks:",
-            font=ctk.CTkFont(weight="bold"),
+            font=get_font(weight="bold"),
             anchor="w"
         )
         task_label.pack(fill="x", pady=(0, 5))
@@ -285,7 +286,7 @@ class DataViewer(ctk.CTkFrame):
         viz_label = ctk.CTkLabel(
             parent,
             text="Data Visualization",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         viz_label.pack(pady=10)
 
@@ -310,7 +311,7 @@ class DataViewer(ctk.CTkFrame):
         stats_label = ctk.CTkLabel(
             parent,
             text="Statistics",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         stats_label.pack(pady=10)
 
@@ -325,7 +326,7 @@ class DataViewer(ctk.CTkFrame):
         export_label = ctk.CTkLabel(
             parent,
             text="Export Options",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         export_label.pack(pady=(20, 10))
 
@@ -369,7 +370,7 @@ class DataViewer(ctk.CTkFrame):
         report_label = ctk.CTkLabel(
             parent,
             text="Reports",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         report_label.pack(pady=(20, 10))
 
@@ -783,7 +784,7 @@ class DataViewer(ctk.CTkFrame):
             title_suffix = ""
             for task in self.current_data['task_name'].unique():
                 task_data = self.current_data[self.current_data['task_name'] == task]
-                display_name = TaskType.get_display_name(TaskType(task))
+                display_name = TaskType.display_name_of(task)
                 ax.plot(task_data['trial_number'], task_data['risk_level'],
                         marker='o', label=display_name, linewidth=2, markersize=6)
 
@@ -847,7 +848,7 @@ class DataViewer(ctk.CTkFrame):
 
             for task in valid_data['task_name'].unique():
                 task_data = valid_data[valid_data['task_name'] == task]
-                display_name = TaskType.get_display_name(TaskType(task))
+                display_name = TaskType.display_name_of(task)
 
                 ax.plot(task_data['trial_number'], task_data['actions'],
                         marker='o', label=display_name, linewidth=2, markersize=6)
@@ -900,7 +901,7 @@ class DataViewer(ctk.CTkFrame):
             return
 
         # Rename columns to display names
-        corr_data.columns = [TaskType.get_display_name(TaskType(col)) for col in corr_data.columns]
+        corr_data.columns = [TaskType.display_name_of(col) for col in corr_data.columns]
 
         # Calculate correlation
         correlation = corr_data.corr()
@@ -981,7 +982,7 @@ class DataViewer(ctk.CTkFrame):
         stats_lines.append("\n=== Task Statistics ===")
         for task in self.current_data['task_name'].unique():
             task_data = self.current_data[self.current_data['task_name'] == task]
-            display_name = TaskType.get_display_name(TaskType(task))
+            display_name = TaskType.display_name_of(task)
 
             stats_lines.append(f"\n{display_name}:")
             stats_lines.append(f"  Trials: {len(task_data)}")
@@ -1149,7 +1150,7 @@ class DataViewer(ctk.CTkFrame):
                         selected_tasks = self.get_selected_tasks()
                         f.write(f"Analysis includes {len(selected_tasks)} tasks:\n")
                         for task in selected_tasks:
-                            f.write(f"  - {TaskType.get_display_name(TaskType(task))}\n")
+                            f.write(f"  - {TaskType.display_name_of(task)}\n")
                         f.write("\n")
 
                         # Session details
@@ -1181,7 +1182,7 @@ class DataViewer(ctk.CTkFrame):
                         selected_tasks = self.get_selected_tasks()
                         f.write(f"Analysis includes {len(selected_tasks)} tasks:\n")
                         for task in selected_tasks:
-                            f.write(f"  - {TaskType.get_display_name(TaskType(task))}\n")
+                            f.write(f"  - {TaskType.display_name_of(task)}\n")
                         f.write("\n")
 
                         f.write("ENROLLMENT STATISTICS\n")
@@ -1195,7 +1196,7 @@ class DataViewer(ctk.CTkFrame):
 
                         for task_name, task_stats in stats['task_statistics'].items():
                             if task_name in selected_tasks:
-                                display_name = TaskType.get_display_name(TaskType(task_name))
+                                display_name = TaskType.display_name_of(task_name)
                                 f.write(f"\n{display_name}:\n")
                                 f.write(f"  Trials: {task_stats['trial_count']}\n")
                                 f.write(f"  Avg Risk: {task_stats['avg_risk']:.3f}\n")
@@ -1235,7 +1236,7 @@ class DataViewer(ctk.CTkFrame):
                     selected_tasks = self.get_selected_tasks()
                     f.write(f"Analysis includes {len(selected_tasks)} tasks:\n")
                     for task in selected_tasks:
-                        f.write(f"  - {TaskType.get_display_name(TaskType(task))}\n")
+                        f.write(f"  - {TaskType.display_name_of(task)}\n")
                     f.write("\n")
 
                     f.write("TASK STATISTICS\n")
@@ -1243,7 +1244,7 @@ class DataViewer(ctk.CTkFrame):
 
                     for task_name, task_data in task_stats.items():
                         if task_name in selected_tasks:
-                            display_name = TaskType.get_display_name(TaskType(task_name))
+                            display_name = TaskType.display_name_of(task_name)
                             f.write(f"\n{display_name}:\n")
                             f.write(f"  Trials: {task_data['trial_count']}\n")
                             f.write(f"  Avg Risk: {task_data['avg_risk']:.3f}\n")
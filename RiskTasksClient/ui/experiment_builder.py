@@ -6,29 +6,209 @@ Handles empty inputs and allows 0 session gap for immediate sessions.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import json
 import random
 import string
-from typing import Dict, List, Optional, Tuple
-import copy
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 from database.db_manager import DatabaseManager
 from database.models import TaskType, Experiment, ExperimentConfig
+from utils.fonts import get_font
+
+# Task types and their display names, resolved once at import
+_TASK_TYPES = tuple(TaskType)
+_TASK_DISPLAY = {t.value: TaskType.get_display_name(t) for t in _TASK_TYPES}
+_DISPLAY_TO_TASK = {name: value for value, name in _TASK_DISPLAY.items()}
+
+# Experiment code suffix letters (codes look like EXP123A)
+_CODE_LETTERS = string.ascii_uppercase
+
+# Per-task block of the experiment analytics report
+_TASK_STATS_TEMPLATE = (
+    "\n{display_name}:\n"
+    "  Trials: {trial_count}\n"
+    "  Avg Risk Level: {avg_risk:.3f}\n"
+    "  Avg Points: {avg_points:.1f}\n"
+    "  Success Rate: {success_rate:.1%}\n"
+)
+
+# Override fields per task type: (config key, widget key or (min, max) widget keys,
+# value type, label used in error messages)
+_TASK_PARAM_SCHEMA = {
+    'bart': (
+        ('max_pumps', 'max_pumps', int, "Max pumps"),
+        ('points_per_pump', 'points_per_pump', int, "Points per pump"),
+        ('explosion_range', ('explosion_min', 'explosion_max'), int, "Explosion range"),
+        ('keyboard_input_mode', 'keyboard_input_mode', bool, "Keyboard mode"),
+        ('balloon_color', 'balloon_color', str, "Balloon color"),
+        ('random_colors', 'random_colors', bool, "Random colors"),
+    ),
+    'ice_fishing': (
+        ('max_fish', 'max_fish', int, "Max fish"),
+        ('points_per_fish', 'points_per_fish', int, "Points per fish"),
+    ),
+    'mountain_mining': (
+        ('max_ore', 'max_ore', int, "Max ore"),
+        ('points_per_ore', 'points_per_ore', int, "Points per ore"),
+    ),
+    'spinning_bottle': (
+        ('segments', 'segments', int, "Segments"),
+        ('points_per_add', 'points_per_add', int, "Points per add"),
+        ('spin_speed_range', ('speed_min', 'speed_max'), float, "Speed range"),
+        ('win_color', 'win_color', str, "Win color"),
+        ('loss_color', 'loss_color', str, "Loss color"),
+    ),
+}
+
+
+def _new_experiment_code(existing_codes) -> str:
+    """Pick a random experiment code (EXP + 3 digits + letter) not in existing_codes."""
+    while True:
+        # One draw covers both the number and the letter
+        n = random.randrange(900 * len(_CODE_LETTERS))
+        code = f"EXP{100 + n // len(_CODE_LETTERS)}{_CODE_LETTERS[n % len(_CODE_LETTERS)]}"
+        if code not in existing_codes:
+            return code
+
+
+def _parse_form_date(text: str) -> datetime:
+    """Parse a YYYY-MM-DD form date to midnight of that day.
+
+    Only the exact YYYY-MM-DD layout is accepted; fromisoformat alone would
+    also take times, week dates and the basic format (YYYYMMDD).
+    """
+    if len(text) != 10 or text[4] != "-" or text[7] != "-":
+        raise ValueError(f"Not a YYYY-MM-DD date: {text!r}")
+    return datetime.combine(date.fromisoformat(text), datetime.min.time())
+
+
+def _set_override_value(widget, value):
+    """Put a value into an override control: a plain entry or a Tk variable."""
+    if isinstance(widget, ctk.CTkEntry):
+        widget.delete(0, "end")
+        if value != "":
+            widget.insert(0, value)
+    else:
+        widget.set(value)
+
+
+def _make_config_loader(fields):
+    """Build a function that copies a task config into its override widgets.
+
+    Whether each field is a range, a checkbox or a plain entry is resolved
+    here once instead of on every load.
+    """
+    steps = []
+    for config_key, widget_keys, value_type, _ in fields:
+        if isinstance(widget_keys, tuple):
+            def step(config, widgets, key=config_key, widget_keys=widget_keys):
+                for widget_key, part in zip(widget_keys, config[key]):
+                    _set_override_value(widgets[widget_key], str(part))
+        elif value_type is bool:
+            def step(config, widgets, key=config_key, widget_key=widget_keys):
+                widgets[widget_key].set(config[key])
+        else:
+            def step(config, widgets, key=config_key, widget_key=widget_keys):
+                _set_override_value(widgets[widget_key], str(config[key]))
+        steps.append((config_key, step))
+
+    def load(config, widgets):
+        for config_key, step in steps:
+            if config_key in config:
+                step(config, widgets)
+
+    return load
+
+
+# Specialized config -> widget loaders, one per task type
+_TASK_CONFIG_LOADERS = {
+    task: _make_config_loader(fields) for task, fields in _TASK_PARAM_SCHEMA.items()
+}
 
 
 class ExperimentBuilder(ctk.CTkFrame):
     """UI component for building and managing experiments."""
 
+    # Number of experiments fetched per page in the experiment list
+    EXPERIMENT_PAGE_SIZE = 100
+
+    # How often (ms) the Tk thread checks for finished background queries
+    DB_POLL_INTERVAL_MS = 20
+
+    # How many fresh codes to try when a generated code is already taken
+    CODE_RETRY_ATTEMPTS = 5
+
+    # Refreshes requested within this many ms of each other are coalesced
+    REFRESH_DEBOUNCE_MS = 100
+
+    # How long (seconds) a fetched experiment row is reused while
+    # experiments_version is unchanged; an upper bound on staleness
+    EXPERIMENT_CACHE_TTL = 5.0
+
     def __init__(self, parent, db_manager: DatabaseManager):
         super().__init__(parent)
         self.db_manager = db_manager
         self.current_experiment_id = None
+        self._generated_code = None
+
+        # Read queries run on a single worker thread with its own connection,
+        # since SQLite connections cannot be shared across threads
+        self._db_pool = ThreadPoolExecutor(max_workers=1)
+        self._worker_db_manager = None
+        self._db_poll_jobs = {}  # {future: pending _poll_db_query after id}
+        self._destroyed = False
+
+        # Experiment list paging state
+        self._loaded_rows = 0
+
+        # experiments_version seen at the last list refresh, and any pending refresh
+        self._last_exp_version = None
+        self._refresh_after_id = None
+
+        # Recently fetched experiments: id -> (fetch time, experiments_version, row)
+        self._experiment_cache: Dict[int, Tuple[float, Tuple[int, int], Dict]] = {}
+        self._exp_row_values = {}  # {tree iid: row values currently shown}
+
         self.temp_config = {}
 
         # Store task instances (allows same task with different configs)
         self.task_instances = {}  # {instance_id: {task_type, display_name, config}}
         self.next_instance_id = 1
+        self._task_type_counts = {}  # {task_type: number of instances}, kept in step with task_instances
+
+        # Task cards hidden on removal, reused by create_task_instance_ui
+        self._task_card_pool = []  # [(card, task label, config btn, remove btn, status label)]
+
+        # Set while a saved experiment is loaded into the form, so the fixed
+        # sequence inputs are rebuilt once at the end instead of per change
+        self._sequence_updates_suspended = False
+
+        # Fixed sequence dropdown variables per session, filled by update_sequence_inputs
+        self.sequence_vars = {}
+
+        # Cached build_experiment_config() result, invalidated on form changes
+        self._config_dirty = True
+        self._cached_config = None
+
+        # Configuration preview window, reused between previews
+        self._preview_window = None
+        self._preview_text = None
+        self._preview_shown = None  # JSON text currently displayed
+
+        # Override dialog builders per task type
+        self._override_builders = {
+            'bart': self._create_bart_overrides,
+            'ice_fishing': self._create_ice_fishing_overrides,
+            'mountain_mining': self._create_mining_overrides,
+            'spinning_bottle': self._create_stb_overrides,
+        }
+
+        # Override dialogs per task type, withdrawn on close and reused
+        self._config_dialogs = {}
 
         # Setup UI
         self.setup_ui()
@@ -51,13 +231,94 @@ class ExperimentBuilder(ctk.CTkFrame):
         except tk.TclError:
             return default
 
+    def destroy(self):
+        """Stop pending polls and the background query worker before destroying the widget."""
+        if not self._destroyed:
+            self._destroyed = True
+            if self._refresh_after_id is not None:
+                self.after_cancel(self._refresh_after_id)
+            for job in self._db_poll_jobs.values():
+                self.after_cancel(job)
+            self._db_poll_jobs.clear()
+            self._db_pool.submit(self._close_worker_db)
+            self._db_pool.shutdown(wait=False)
+        super().destroy()
+
+    def get_experiment(self, experiment_id: int) -> Optional[Dict]:
+        """Get an experiment by ID, reusing a recent fetch if nothing was written since."""
+        now = time.monotonic()
+        version = self.db_manager.experiments_version
+        cached = self._experiment_cache.get(experiment_id)
+        if cached and cached[1] == version and now - cached[0] < self.EXPERIMENT_CACHE_TTL:
+            return cached[2]
+
+        experiment = self.db_manager.get_experiment(experiment_id=experiment_id)
+        if experiment:
+            self._experiment_cache[experiment_id] = (now, version, experiment)
+        else:
+            self._experiment_cache.pop(experiment_id, None)
+        return experiment
+
+    def _run_db_query(self, callback: Callable, method_name: str, *args, **kwargs):
+        """Run a DatabaseManager read on the worker thread.
+
+        callback receives the result on the Tk thread once the query finishes.
+        """
+        if self._destroyed:
+            return
+        future = self._db_pool.submit(self._call_worker_db, method_name, args, kwargs)
+        self._poll_db_query(future, callback)
+
+    def _call_worker_db(self, method_name: str, args: tuple, kwargs: dict):
+        """Call a DatabaseManager method on the worker thread's connection."""
+        if self._worker_db_manager is None:
+            # The Tk thread's manager has already set up the schema
+            self._worker_db_manager = DatabaseManager(self.db_manager.db_path)
+            self._worker_db_manager.connect()
+        return getattr(self._worker_db_manager, method_name)(*args, **kwargs)
+
+    def _close_worker_db(self):
+        """Close the worker thread's connection."""
+        if self._worker_db_manager is not None:
+            self._worker_db_manager.close()
+            self._worker_db_manager = None
+
+    def _poll_db_query(self, future, callback: Callable):
+        """Hand a finished query result to its callback, or check again shortly."""
+        self._db_poll_jobs.pop(future, None)
+        if self._destroyed:
+            return
+        if not future.done():
+            self._db_poll_jobs[future] = self.after(
+                self.DB_POLL_INTERVAL_MS, self._poll_db_query, future, callback
+            )
+            return
+
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror("Database Error", f"Failed to load data: {e}")
+            return
+
+        callback(result)
+
+    def _mark_config_dirty(self, *args):
+        """Invalidate the cached experiment configuration."""
+        self._config_dirty = True
+
+    def set_entry_text(self, entry: ctk.CTkEntry, text: str):
+        """Replace the contents of an entry that has no textvariable."""
+        entry.delete(0, "end")
+        if text:
+            entry.insert(0, text)
+
     def setup_ui(self):
         """Setup the experiment builder interface."""
         # Title
         title_label = ctk.CTkLabel(
             self,
             text="Experiment Builder",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=20)
 
@@ -73,12 +334,31 @@ class ExperimentBuilder(ctk.CTkFrame):
         # Tab 2: Create/Edit Experiment - REDESIGNED
         self.builder_frame = ctk.CTkFrame(self.notebook)
         self.notebook.add(self.builder_frame, text="Builder")
-        self.create_redesigned_builder_tab()
 
         # Tab 3: Experiment Analytics
         self.analytics_frame = ctk.CTkFrame(self.notebook)
         self.notebook.add(self.analytics_frame, text="Analytics")
-        self.create_analytics_tab()
+
+        # The Builder and Analytics contents are built the first time they're needed
+        self._tab_builders = {1: self._build_builder_tab, 2: self.create_analytics_tab}
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's contents if this is its first visit."""
+        self.ensure_tab_built(self.notebook.index("current"))
+
+    def ensure_tab_built(self, index: int):
+        """Build a lazily created tab now if it hasn't been built yet."""
+        build = self._tab_builders.pop(index, None)
+        if build:
+            build()
+
+    def _build_builder_tab(self):
+        """Build the Builder tab and start tracking its form for config changes."""
+        self.create_redesigned_builder_tab()
+
+        for var in (self.trials_var, self.gap_var, self.tasks_per_session_var, self.sequence_type_var):
+            var.trace_add("write", self._mark_config_dirty)
 
     def create_experiment_list_tab(self):
         """Create the experiment list tab."""
@@ -102,6 +382,15 @@ class ExperimentBuilder(ctk.CTkFrame):
         )
         refresh_btn.pack(side="right", padx=5)
 
+        self.load_more_btn = ctk.CTkButton(
+            controls_frame,
+            text="Load More",
+            command=self.load_more_experiments,
+            state="disabled",
+            width=100
+        )
+        self.load_more_btn.pack(side="right", padx=5)
+
         # Experiment list
         list_container = ctk.CTkFrame(self.list_frame)
         list_container.pack(fill="both", expand=True, padx=20, pady=10)
@@ -182,6 +471,10 @@ class ExperimentBuilder(ctk.CTkFrame):
         )
         self.view_stats_btn.pack(side="left", padx=5)
 
+        # Buttons that depend on an experiment being selected
+        self._action_buttons = (self.edit_btn, self.duplicate_btn, self.toggle_btn, self.view_stats_btn)
+        self._action_btn_state = "disabled"
+
     def create_redesigned_builder_tab(self):
         """Create the redesigned experiment builder tab with improved layout."""
         # Create main container with two columns
@@ -219,7 +512,7 @@ class ExperimentBuilder(ctk.CTkFrame):
             command=self.save_experiment,
             width=150,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         save_btn.pack(side="left", padx=10)
 
@@ -252,59 +545,52 @@ class ExperimentBuilder(ctk.CTkFrame):
         section_label = ctk.CTkLabel(
             header_frame,
             text="📋 Basic Information",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         section_label.pack(side="left")
 
         info_frame = ctk.CTkFrame(parent)
         info_frame.pack(fill="x", pady=10)
 
-        # Two-column layout for basic fields
-        left_col = ctk.CTkFrame(info_frame, fg_color="transparent")
-        left_col.pack(side="left", fill="both", expand=True, padx=10)
-
-        right_col = ctk.CTkFrame(info_frame, fg_color="transparent")
-        right_col.pack(side="right", fill="both", expand=True, padx=10)
+        # All basic fields share one grid: code + generate button | max participants,
+        # then full-width name and description rows
+        info_frame.grid_columnconfigure(0, weight=1)
+        info_frame.grid_columnconfigure(2, weight=1)
 
         # Experiment code (left column)
-        code_label = ctk.CTkLabel(left_col, text="Experiment Code", anchor="w")
-        code_label.pack(fill="x", pady=(5, 2))
-
-        code_frame = ctk.CTkFrame(left_col, fg_color="transparent")
-        code_frame.pack(fill="x")
+        code_label = ctk.CTkLabel(info_frame, text="Experiment Code", anchor="w")
+        code_label.grid(row=0, column=0, columnspan=2, sticky="ew", padx=(10, 0), pady=(5, 2))
 
         self.code_var = tk.StringVar()
         self.code_entry = ctk.CTkEntry(
-            code_frame,
+            info_frame,
             textvariable=self.code_var,
             placeholder_text="e.g., EXP001"
         )
-        self.code_entry.pack(side="left", fill="x", expand=True)
+        self.code_entry.grid(row=1, column=0, sticky="ew", padx=(10, 0))
 
         generate_btn = ctk.CTkButton(
-            code_frame,
+            info_frame,
             text="🎲",
             command=self.generate_experiment_code,
             width=30,
             height=28
         )
-        generate_btn.pack(side="right", padx=(5, 0))
+        generate_btn.grid(row=1, column=1, padx=(5, 10))
 
         # Max participants (right column)
-        max_label = ctk.CTkLabel(right_col, text="Max Participants", anchor="w")
-        max_label.pack(fill="x", pady=(5, 2))
+        max_label = ctk.CTkLabel(info_frame, text="Max Participants", anchor="w")
+        max_label.grid(row=0, column=2, sticky="ew", padx=10, pady=(5, 2))
 
-        self.max_participants_var = tk.StringVar()
         self.max_participants_entry = ctk.CTkEntry(
-            right_col,
-            textvariable=self.max_participants_var,
+            info_frame,
             placeholder_text="Leave empty for unlimited"
         )
-        self.max_participants_entry.pack(fill="x")
+        self.max_participants_entry.grid(row=1, column=2, sticky="ew", padx=10)
 
         # Name (full width)
         name_label = ctk.CTkLabel(info_frame, text="Experiment Name", anchor="w")
-        name_label.pack(fill="x", padx=10, pady=(15, 2))
+        name_label.grid(row=2, column=0, columnspan=3, sticky="ew", padx=10, pady=(15, 2))
 
         self.name_var = tk.StringVar()
         name_entry = ctk.CTkEntry(
@@ -312,20 +598,24 @@ class ExperimentBuilder(ctk.CTkFrame):
             textvariable=self.name_var,
             placeholder_text="Give your experiment a descriptive name"
         )
-        name_entry.pack(fill="x", padx=10, pady=(0, 10))
+        name_entry.grid(row=3, column=0, columnspan=3, sticky="ew", padx=10, pady=(0, 10))
 
         # Description
         desc_label = ctk.CTkLabel(info_frame, text="Description", anchor="w")
-        desc_label.pack(fill="x", padx=10, pady=(5, 2))
+        desc_label.grid(row=4, column=0, columnspan=3, sticky="ew", padx=10, pady=(5, 2))
 
         self.desc_text = ctk.CTkTextbox(info_frame, height=80)
-        self.desc_text.pack(fill="x", padx=10, pady=(0, 10))
+        self.desc_text.grid(row=5, column=0, columnspan=3, sticky="ew", padx=10, pady=(0, 10))
+
+        # Date settings in a collapsible frame, filled in the first time it is opened
+        self.date_frame = ctk.CTkFrame(parent)
+        self.start_date_entry = None
+        self.end_date_entry = None
 
-        # Date settings in a collapsible frame
         date_toggle = ctk.CTkButton(
             parent,
             text="📅 Date Settings (Optional) ▼",
-            command=lambda: self.toggle_frame(date_frame),
+            command=self.toggle_date_settings,
             fg_color="transparent",
             text_color=("gray10", "gray90"),
             hover=False,
@@ -333,35 +623,28 @@ class ExperimentBuilder(ctk.CTkFrame):
         )
         date_toggle.pack(fill="x", pady=5)
 
-        self.date_frame = date_frame = ctk.CTkFrame(parent)
-        date_frame.pack(fill="x", pady=5)
-        date_frame.pack_forget()  # Initially hidden
-
-        # Date fields
-        dates_container = ctk.CTkFrame(date_frame, fg_color="transparent")
+    def _build_date_fields(self):
+        """Create the start/end date entries inside the (hidden) date frame."""
+        dates_container = ctk.CTkFrame(self.date_frame, fg_color="transparent")
         dates_container.pack(fill="x", padx=20, pady=10)
 
         start_label = ctk.CTkLabel(dates_container, text="Start Date:", width=100, anchor="w")
         start_label.grid(row=0, column=0, sticky="w", pady=5)
 
-        self.start_date_var = tk.StringVar()
-        start_entry = ctk.CTkEntry(
+        self.start_date_entry = ctk.CTkEntry(
             dates_container,
-            textvariable=self.start_date_var,
             placeholder_text="YYYY-MM-DD"
         )
-        start_entry.grid(row=0, column=1, sticky="ew", padx=10, pady=5)
+        self.start_date_entry.grid(row=0, column=1, sticky="ew", padx=10, pady=5)
 
         end_label = ctk.CTkLabel(dates_container, text="End Date:", width=100, anchor="w")
         end_label.grid(row=1, column=0, sticky="w", pady=5)
 
-        self.end_date_var = tk.StringVar()
-        end_entry = ctk.CTkEntry(
+        self.end_date_entry = ctk.CTkEntry(
             dates_container,
-            textvariable=self.end_date_var,
             placeholder_text="YYYY-MM-DD"
         )
-        end_entry.grid(row=1, column=1, sticky="ew", padx=10, pady=5)
+        self.end_date_entry.grid(row=1, column=1, sticky="ew", padx=10, pady=5)
 
         dates_container.columnconfigure(1, weight=1)
 
@@ -374,7 +657,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         section_label = ctk.CTkLabel(
             header_frame,
             text="⚙️ Experiment Parameters",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         section_label.pack(side="left")
 
@@ -389,7 +672,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         trials_card = ctk.CTkFrame(params_grid)
         trials_card.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
 
-        ctk.CTkLabel(trials_card, text="Trials per Task", font=ctk.CTkFont(weight="bold")).pack(pady=(10, 5))
+        ctk.CTkLabel(trials_card, text="Trials per Task", font=get_font(weight="bold")).pack(pady=(10, 5))
 
         # Use StringVar instead of IntVar for better empty handling
         self.trials_var = tk.StringVar(value="30")
@@ -399,13 +682,13 @@ class ExperimentBuilder(ctk.CTkFrame):
         # Add validation
         trials_entry.bind('<FocusOut>', lambda e: self.validate_int_entry_string(self.trials_var, "30", 1, 100, "Trials per task"))
 
-        ctk.CTkLabel(trials_card, text="(1-100)", font=ctk.CTkFont(size=11), text_color="gray").pack(pady=(0, 10))
+        ctk.CTkLabel(trials_card, text="(1-100)", font=get_font(11), text_color="gray").pack(pady=(0, 10))
 
         # Session gap card
         gap_card = ctk.CTkFrame(params_grid)
         gap_card.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
 
-        ctk.CTkLabel(gap_card, text="Session Gap (days)", font=ctk.CTkFont(weight="bold")).pack(pady=(10, 5))
+        ctk.CTkLabel(gap_card, text="Session Gap (days)", font=get_font(weight="bold")).pack(pady=(10, 5))
 
         self.gap_var = tk.StringVar(value="14")
         gap_entry = ctk.CTkEntry(gap_card, textvariable=self.gap_var, width=100)
@@ -414,50 +697,48 @@ class ExperimentBuilder(ctk.CTkFrame):
         # Add validation - now allows 0 for immediate sessions
         gap_entry.bind('<FocusOut>', lambda e: self.validate_int_entry_string(self.gap_var, "14", 0, 365, "Session gap"))
 
-        ctk.CTkLabel(gap_card, text="(0 = immediate)", font=ctk.CTkFont(size=11), text_color="gray").pack(pady=(0, 10))
+        ctk.CTkLabel(gap_card, text="(0 = immediate)", font=get_font(11), text_color="gray").pack(pady=(0, 10))
 
         # Tasks per session card
         tasks_card = ctk.CTkFrame(params_grid)
         tasks_card.grid(row=1, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
 
-        ctk.CTkLabel(tasks_card, text="Tasks per Session", font=ctk.CTkFont(weight="bold")).pack(pady=(10, 5))
+        ctk.CTkLabel(tasks_card, text="Tasks per Session", font=get_font(weight="bold")).pack(pady=(10, 5))
 
         tasks_frame = ctk.CTkFrame(tasks_card, fg_color="transparent")
         tasks_frame.pack(pady=(0, 10))
 
         self.tasks_per_session_var = tk.IntVar(value=2)
+        self._last_tasks_per_session = 2
+        self.tasks_per_session_var.trace_add("write", self.on_tasks_per_session_change)
 
         # Radio buttons for common choices
         ctk.CTkRadioButton(
             tasks_frame,
             text="1 task",
             variable=self.tasks_per_session_var,
-            value=1,
-            command=self.on_tasks_per_session_change
+            value=1
         ).pack(side="left", padx=10)
 
         ctk.CTkRadioButton(
             tasks_frame,
             text="2 tasks",
             variable=self.tasks_per_session_var,
-            value=2,
-            command=self.on_tasks_per_session_change
+            value=2
         ).pack(side="left", padx=10)
 
         ctk.CTkRadioButton(
             tasks_frame,
             text="3 tasks",
             variable=self.tasks_per_session_var,
-            value=3,
-            command=self.on_tasks_per_session_change
+            value=3
         ).pack(side="left", padx=10)
 
         ctk.CTkRadioButton(
             tasks_frame,
             text="4 tasks",
             variable=self.tasks_per_session_var,
-            value=4,
-            command=self.on_tasks_per_session_change
+            value=4
         ).pack(side="left", padx=10)
 
         params_grid.columnconfigure(0, weight=1)
@@ -540,7 +821,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         section_label = ctk.CTkLabel(
             header_frame,
             text="🎮 Task Configuration",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         section_label.pack(side="left")
 
@@ -548,7 +829,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         help_label = ctk.CTkLabel(
             header_frame,
             text="Add tasks and configure their parameters",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         help_label.pack(side="left", padx=(20, 0))
@@ -560,7 +841,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         selection_label = ctk.CTkLabel(
             selection_frame,
             text="Add a task to your experiment:",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         selection_label.pack(pady=(10, 5))
 
@@ -572,7 +853,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         task_menu = ctk.CTkOptionMenu(
             task_options_frame,
             variable=self.task_type_var,
-            values=[TaskType.get_display_name(t) for t in TaskType],
+            values=list(_TASK_DISPLAY.values()),
             width=200
         )
         task_menu.pack(side="left", padx=10)
@@ -591,7 +872,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         list_label = ctk.CTkLabel(
             parent,
             text="Tasks in this experiment:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         list_label.pack(fill="x", padx=20, pady=(20, 5))
 
@@ -611,7 +892,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         assign_label = ctk.CTkLabel(
             assign_frame,
             text="📅 Session Assignment",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         assign_label.pack(side="left")
 
@@ -639,10 +920,18 @@ class ExperimentBuilder(ctk.CTkFrame):
         )
         fixed_radio.pack(side="left", padx=20)
 
-        # Fixed sequence configuration
-        self.fixed_sequence_frame = ctk.CTkFrame(parent)
-        self.sequence_dropdowns_frame = ctk.CTkFrame(self.fixed_sequence_frame)
-        self.sequence_dropdowns_frame.pack(fill="x", padx=20, pady=10)
+        # Fixed sequence configuration, built the first time fixed mode is selected
+        self._sequence_parent = parent
+        self.fixed_sequence_frame = None
+        self.sequence_dropdowns_frame = None
+
+        # Recycled sequence widgets, hidden with grid_forget() instead of destroyed
+        self._sequence_menu_pool = {}  # {(session, task_num): (menu, var)}
+        self._sequence_session_labels = {}  # {session: label}
+        self._sequence_info_label = None
+
+        # (task option names, tasks per session) the dropdowns were last built for
+        self._sequence_inputs_key = None
 
     def add_task_instance(self):
         """Add a new task instance to the experiment."""
@@ -652,11 +941,7 @@ class ExperimentBuilder(ctk.CTkFrame):
             return
 
         # Find the task type
-        task_type = None
-        for t in TaskType:
-            if TaskType.get_display_name(t) == task_display:
-                task_type = t.value
-                break
+        task_type = _DISPLAY_TO_TASK.get(task_display)
 
         if not task_type:
             return
@@ -666,8 +951,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         self.next_instance_id += 1
 
         # Check if this is a duplicate task type
-        existing_count = sum(1 for inst in self.task_instances.values()
-                             if inst['task_type'] == task_type)
+        existing_count = self._task_type_counts.get(task_type, 0)
 
         if existing_count > 0:
             # Create a unique display name for the duplicate
@@ -681,6 +965,9 @@ class ExperimentBuilder(ctk.CTkFrame):
             'display_name': display_name,
             'config': {}  # Will be populated when user configures
         }
+        self._task_type_counts[task_type] = existing_count + 1
+
+        self._mark_config_dirty()
 
         # Create UI for this instance
         self.create_task_instance_ui(instance_id)
@@ -689,13 +976,46 @@ class ExperimentBuilder(ctk.CTkFrame):
         if self.sequence_type_var.get() == "fixed":
             self.update_sequence_inputs()
 
-    def create_task_instance_ui(self, instance_id):
-        """Create UI for a task instance in the list."""
+    def create_task_instance_ui(self, instance_id, pack: bool = True):
+        """Create UI for a task instance in the list.
+
+        Cards released by earlier removals are reused before new ones are built.
+        Pass pack=False when building several cards at once and pack them
+        together afterwards, so the list is laid out in a single pass.
+        """
         instance = self.task_instances[instance_id]
 
-        # Create card for this task instance
+        if self._task_card_pool:
+            parts = self._task_card_pool.pop()
+        else:
+            parts = self._build_task_card()
+        card, task_label, config_btn, remove_btn, status_label = parts
+
+        # Point the card at this instance
+        task_label.configure(text=f"🎯 {instance['display_name']}")
+        config_btn.configure(command=partial(self.configure_task_instance, instance_id))
+        remove_btn.configure(command=partial(self.remove_task_instance, instance_id))
+
+        # Status indicator
+        if instance['config']:
+            status_label.configure(text="✅ Configured", text_color="green")
+        else:
+            status_label.configure(text="⚠️ Not configured (using defaults)", text_color="orange")
+
+        if pack:
+            card.pack(fill="x", pady=5)
+
+        # Store the card and status label references
+        instance['ui_card'] = card
+        instance['status_label'] = status_label
+        instance['ui_parts'] = parts
+
+    def _build_task_card(self):
+        """Build an empty task instance card.
+
+        Returns (card, task label, configure button, remove button, status label).
+        """
         card = ctk.CTkFrame(self.task_list_frame)
-        card.pack(fill="x", pady=5)
 
         # Header with task name and actions
         header_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -704,8 +1024,8 @@ class ExperimentBuilder(ctk.CTkFrame):
         # Task icon and name
         task_label = ctk.CTkLabel(
             header_frame,
-            text=f"🎯 {instance['display_name']}",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text="",
+            font=get_font(14, "bold"),
             anchor="w"
         )
         task_label.pack(side="left", fill="x", expand=True)
@@ -714,7 +1034,6 @@ class ExperimentBuilder(ctk.CTkFrame):
         config_btn = ctk.CTkButton(
             header_frame,
             text="⚙️ Configure",
-            command=lambda: self.configure_task_instance(instance_id),
             width=100,
             height=30,
             fg_color="blue"
@@ -725,55 +1044,81 @@ class ExperimentBuilder(ctk.CTkFrame):
         remove_btn = ctk.CTkButton(
             header_frame,
             text="❌ Remove",
-            command=lambda: self.remove_task_instance(instance_id),
             width=80,
             height=30,
             fg_color="red"
         )
         remove_btn.pack(side="left", padx=5)
 
-        # Status indicator
-        if instance['config']:
-            status_text = "✅ Configured"
-            status_color = "green"
-        else:
-            status_text = "⚠️ Not configured (using defaults)"
-            status_color = "orange"
-
         status_label = ctk.CTkLabel(
             card,
-            text=status_text,
-            font=ctk.CTkFont(size=12),
-            text_color=status_color
+            text="",
+            font=get_font(12)
         )
         status_label.pack(fill="x", padx=10, pady=(0, 10))
 
-        # Store the card reference
-        instance['ui_card'] = card
+        return card, task_label, config_btn, remove_btn, status_label
+
+    def _release_task_card(self, instance):
+        """Hide an instance's card and keep it for the next instance added."""
+        parts = instance.get('ui_parts')
+        if parts:
+            parts[0].pack_forget()
+            self._task_card_pool.append(parts)
 
     def configure_task_instance(self, instance_id):
         """Show configuration dialog for a specific task instance."""
         instance = self.task_instances[instance_id]
         task_type = instance['task_type']
 
+        cached = self._config_dialogs.get(task_type)
+        if cached is None:
+            cached = self._config_dialogs[task_type] = self._create_config_dialog(task_type)
+        dialog, title_label, override_widgets, save_btn = cached
+
+        # Point the dialog at this instance
+        title = f"Configure {instance['display_name']}"
+        dialog.title(title)
+        title_label.configure(text=title)
+        save_btn.configure(
+            command=partial(self.save_instance_config, dialog, instance_id, override_widgets)
+        )
+
+        # Clear values left over from the previous instance, then load this one's
+        for widget in override_widgets.values():
+            _set_override_value(widget, False if isinstance(widget, tk.BooleanVar) else "")
+        if instance['config']:
+            self._load_instance_config(instance['config'], override_widgets, task_type)
+
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _create_config_dialog(self, task_type):
+        """Build the override dialog for a task type.
+
+        Returns (dialog, title label, override variables, save button).
+        """
         dialog = ctk.CTkToplevel(self)
-        dialog.title(f"Configure {instance['display_name']}")
+        # Keep it unmapped while the rows are packed, so the layout is computed
+        # once when configure_task_instance shows it
+        dialog.withdraw()
         dialog.geometry("500x600")
         dialog.transient(self)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", partial(self._hide_config_dialog, dialog))
 
         # Title
         title_label = ctk.CTkLabel(
             dialog,
-            text=f"Configure {instance['display_name']}",
-            font=ctk.CTkFont(size=20, weight="bold")
+            text="",
+            font=get_font(20, "bold")
         )
         title_label.pack(pady=20)
 
         info_label = ctk.CTkLabel(
             dialog,
             text="Leave fields empty to use default values",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color="gray"
         )
         info_label.pack()
@@ -786,18 +1131,9 @@ class ExperimentBuilder(ctk.CTkFrame):
         override_widgets = {}
 
         # Task-specific configurations
-        if task_type == 'bart':
-            self._create_bart_overrides(scroll_frame, override_widgets)
-        elif task_type == 'ice_fishing':
-            self._create_ice_fishing_overrides(scroll_frame, override_widgets)
-        elif task_type == 'mountain_mining':
-            self._create_mining_overrides(scroll_frame, override_widgets)
-        elif task_type == 'spinning_bottle':
-            self._create_stb_overrides(scroll_frame, override_widgets)
-
-        # Load existing config if any
-        if instance['config']:
-            self._load_instance_config(instance['config'], override_widgets, task_type)
+        create_overrides = self._override_builders.get(task_type)
+        if create_overrides:
+            create_overrides(scroll_frame, override_widgets)
 
         # Buttons
         button_frame = ctk.CTkFrame(dialog)
@@ -806,7 +1142,6 @@ class ExperimentBuilder(ctk.CTkFrame):
         save_btn = ctk.CTkButton(
             button_frame,
             text="Save",
-            command=lambda: self.save_instance_config(dialog, instance_id, override_widgets),
             width=100
         )
         save_btn.pack(side="left", padx=20)
@@ -814,53 +1149,24 @@ class ExperimentBuilder(ctk.CTkFrame):
         cancel_btn = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            command=dialog.destroy,
+            command=partial(self._hide_config_dialog, dialog),
             width=100,
             fg_color="gray"
         )
         cancel_btn.pack(side="left")
 
+        return dialog, title_label, override_widgets, save_btn
+
+    def _hide_config_dialog(self, dialog):
+        """Close an override dialog, keeping it around for the next instance."""
+        dialog.grab_release()
+        dialog.withdraw()
+
     def _load_instance_config(self, config, widgets, task_type):
         """Load existing configuration into widgets."""
-        if task_type == 'bart':
-            if 'max_pumps' in config:
-                widgets['max_pumps'].set(str(config['max_pumps']))
-            if 'points_per_pump' in config:
-                widgets['points_per_pump'].set(str(config['points_per_pump']))
-            if 'explosion_range' in config:
-                widgets['explosion_min'].set(str(config['explosion_range'][0]))
-                widgets['explosion_max'].set(str(config['explosion_range'][1]))
-            if 'keyboard_input_mode' in config:
-                widgets['keyboard_input_mode'].set(config['keyboard_input_mode'])
-            if 'balloon_color' in config:
-                widgets['balloon_color'].set(config['balloon_color'])
-            if 'random_colors' in config:
-                widgets['random_colors'].set(config['random_colors'])
-
-        elif task_type == 'ice_fishing':
-            if 'max_fish' in config:
-                widgets['max_fish'].set(str(config['max_fish']))
-            if 'points_per_fish' in config:
-                widgets['points_per_fish'].set(str(config['points_per_fish']))
-
-        elif task_type == 'mountain_mining':
-            if 'max_ore' in config:
-                widgets['max_ore'].set(str(config['max_ore']))
-            if 'points_per_ore' in config:
-                widgets['points_per_ore'].set(str(config['points_per_ore']))
-
-        elif task_type == 'spinning_bottle':
-            if 'segments' in config:
-                widgets['segments'].set(str(config['segments']))
-            if 'points_per_add' in config:
-                widgets['points_per_add'].set(str(config['points_per_add']))
-            if 'spin_speed_range' in config:
-                widgets['speed_min'].set(str(config['spin_speed_range'][0]))
-                widgets['speed_max'].set(str(config['spin_speed_range'][1]))
-            if 'win_color' in config:
-                widgets['win_color'].set(config['win_color'])
-            if 'loss_color' in config:
-                widgets['loss_color'].set(config['loss_color'])
+        loader = _TASK_CONFIG_LOADERS.get(task_type)
+        if loader:
+            loader(config, widgets)
 
     def save_instance_config(self, dialog, instance_id, widgets):
         """Save configuration for a task instance."""
@@ -870,118 +1176,47 @@ class ExperimentBuilder(ctk.CTkFrame):
         # Build config based on task type
         config = {}
 
-        if task_type == 'bart':
-            # Process BART-specific config
-            if widgets['max_pumps'].get().strip():
-                try:
-                    config['max_pumps'] = int(widgets['max_pumps'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Max pumps must be a number")
-                    return
-
-            if widgets['points_per_pump'].get().strip():
-                try:
-                    config['points_per_pump'] = int(widgets['points_per_pump'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Points per pump must be a number")
-                    return
-
-            if widgets['explosion_min'].get().strip() and widgets['explosion_max'].get().strip():
-                try:
-                    min_val = int(widgets['explosion_min'].get())
-                    max_val = int(widgets['explosion_max'].get())
-                    if min_val >= max_val:
-                        messagebox.showerror("Invalid Value", "Min explosion must be less than max")
+        for config_key, widget_keys, value_type, label in _TASK_PARAM_SCHEMA.get(task_type, ()):
+            if isinstance(widget_keys, tuple):
+                # Min/max range, only saved when both ends are filled in
+                min_str, max_str = (widgets[key].get().strip() for key in widget_keys)
+                if min_str and max_str:
+                    try:
+                        min_val = value_type(min_str)
+                        max_val = value_type(max_str)
+                    except ValueError:
+                        messagebox.showerror("Invalid Value", f"{label} must be numbers")
                         return
-                    config['explosion_range'] = [min_val, max_val]
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Explosion range must be numbers")
-                    return
-
-            config['keyboard_input_mode'] = widgets['keyboard_input_mode'].get()
-            if widgets['balloon_color'].get():
-                config['balloon_color'] = widgets['balloon_color'].get()
-            config['random_colors'] = widgets['random_colors'].get()
-
-        elif task_type == 'ice_fishing':
-            # Process Ice Fishing config
-            if widgets['max_fish'].get().strip():
-                try:
-                    config['max_fish'] = int(widgets['max_fish'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Max fish must be a number")
-                    return
-
-            if widgets['points_per_fish'].get().strip():
-                try:
-                    config['points_per_fish'] = int(widgets['points_per_fish'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Points per fish must be a number")
-                    return
-
-        elif task_type == 'mountain_mining':
-            # Process Mountain Mining config
-            if widgets['max_ore'].get().strip():
-                try:
-                    config['max_ore'] = int(widgets['max_ore'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Max ore must be a number")
-                    return
-
-            if widgets['points_per_ore'].get().strip():
-                try:
-                    config['points_per_ore'] = int(widgets['points_per_ore'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Points per ore must be a number")
-                    return
-
-        elif task_type == 'spinning_bottle':
-            # Process Spinning Bottle config
-            if widgets['segments'].get():
-                try:
-                    config['segments'] = int(widgets['segments'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Segments must be a number")
-                    return
-
-            if widgets['points_per_add'].get().strip():
-                try:
-                    config['points_per_add'] = int(widgets['points_per_add'].get())
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Points per add must be a number")
-                    return
-
-            # Spin speed range
-            if widgets['speed_min'].get().strip() and widgets['speed_max'].get().strip():
-                try:
-                    min_speed = float(widgets['speed_min'].get())
-                    max_speed = float(widgets['speed_max'].get())
-                    if min_speed >= max_speed:
-                        messagebox.showerror("Invalid Value", "Min speed must be less than max speed")
+                    if min_val >= max_val:
+                        messagebox.showerror("Invalid Value", f"{label} minimum must be less than maximum")
                         return
-                    config['spin_speed_range'] = [min_speed, max_speed]
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Speed range must be numbers")
-                    return
+                    config[config_key] = [min_val, max_val]
 
-            # Colors
-            if widgets['win_color'].get():
-                config['win_color'] = widgets['win_color'].get()
-            if widgets['loss_color'].get():
-                config['loss_color'] = widgets['loss_color'].get()
+            elif value_type is bool:
+                config[config_key] = widgets[widget_keys].get()
+
+            else:
+                value_str = widgets[widget_keys].get().strip()
+                if not value_str:
+                    continue
+                if value_type is str:
+                    config[config_key] = value_str
+                else:
+                    try:
+                        config[config_key] = value_type(value_str)
+                    except ValueError:
+                        messagebox.showerror("Invalid Value", f"{label} must be a number")
+                        return
 
         # Save config to instance
         instance['config'] = config
+        self._mark_config_dirty()
 
         # Update UI to show configured status
-        if instance.get('ui_card'):
-            # Find and update status label
-            for widget in instance['ui_card'].winfo_children():
-                if isinstance(widget, ctk.CTkLabel) and ("✅" in widget.cget("text") or "⚠️" in widget.cget("text")):
-                    widget.configure(text="✅ Configured", text_color="green")
-                    break
-
-        dialog.destroy()
+        if instance.get('status_label'):
+            instance['status_label'].configure(text="✅ Configured", text_color="green")
+
+        self._hide_config_dialog(dialog)
         messagebox.showinfo("Success", f"{instance['display_name']} configuration saved!")
 
     def remove_task_instance(self, instance_id):
@@ -995,79 +1230,148 @@ class ExperimentBuilder(ctk.CTkFrame):
             )
 
             if result:
-                # Remove UI
-                if 'ui_card' in instance and instance['ui_card']:
-                    instance['ui_card'].destroy()
+                # Hide the card for reuse
+                self._release_task_card(instance)
 
                 # Remove from dict
                 del self.task_instances[instance_id]
+                self._task_type_counts[instance['task_type']] -= 1
+                self._mark_config_dirty()
 
                 # Update sequence dropdowns if needed
                 if self.sequence_type_var.get() == "fixed":
                     self.update_sequence_inputs()
 
-    def on_tasks_per_session_change(self):
-        """Handle change in tasks per session."""
+    def clear_task_instances(self):
+        """Remove all task instances, keeping their cards for reuse."""
+        # Release the tracked cards directly rather than enumerating the list's children
+        for instance in self.task_instances.values():
+            self._release_task_card(instance)
+
+        self.task_instances = {}
+        self._task_type_counts = {}
+        self.next_instance_id = 1
+        self._sequence_inputs_key = None
+        self._mark_config_dirty()
+
+    def on_tasks_per_session_change(self, *args):
+        """Handle change in tasks per session, ignoring writes of the same value."""
+        value = self.safe_get_int(self.tasks_per_session_var, 2)
+        if value == self._last_tasks_per_session:
+            return
+        self._last_tasks_per_session = value
+
         # Update sequence inputs if in fixed mode
         if self.sequence_type_var.get() == "fixed":
             self.update_sequence_inputs()
 
+    def _build_fixed_sequence_ui(self):
+        """Create the fixed sequence container frames."""
+        self.fixed_sequence_frame = ctk.CTkFrame(self._sequence_parent)
+        self.sequence_dropdowns_frame = ctk.CTkFrame(self.fixed_sequence_frame)
+        self.sequence_dropdowns_frame.pack(fill="x", padx=20, pady=10)
+
     def on_sequence_type_change(self):
         """Handle sequence type change."""
         if self.sequence_type_var.get() == "fixed":
+            if self.fixed_sequence_frame is None:
+                self._build_fixed_sequence_ui()
             self.fixed_sequence_frame.pack(fill="x", padx=20, pady=10)
             self.update_sequence_inputs()
-        else:
+        elif self.fixed_sequence_frame is not None:
             self.fixed_sequence_frame.pack_forget()
 
     def update_sequence_inputs(self):
         """Update fixed sequence input fields based on task instances and tasks per session."""
-        # Clear existing inputs
-        for widget in self.sequence_dropdowns_frame.winfo_children():
-            widget.destroy()
+        self._mark_config_dirty()
+        if self._sequence_updates_suspended:
+            return
 
         if not self.task_instances:
-            info_label = ctk.CTkLabel(
-                self.sequence_dropdowns_frame,
-                text="Add tasks first to configure sequences",
-                text_color="gray"
-            )
-            info_label.pack(pady=20)
+            self._sequence_inputs_key = None
+
+            # Hide existing inputs
+            for menu, _ in self._sequence_menu_pool.values():
+                menu.grid_forget()
+            for label in self._sequence_session_labels.values():
+                label.grid_forget()
+
+            if self._sequence_info_label is None:
+                self._sequence_info_label = ctk.CTkLabel(
+                    self.sequence_dropdowns_frame,
+                    text="Add tasks first to configure sequences",
+                    text_color="gray"
+                )
+            self._sequence_info_label.grid(row=0, column=0, pady=20)
             return
 
+        if self._sequence_info_label is not None:
+            self._sequence_info_label.grid_forget()
+
         # Get task instance names
         task_options = [inst['display_name'] for inst in self.task_instances.values()]
         tasks_per_session = self.safe_get_int(self.tasks_per_session_var, 2)
+        sessions = range(1, 3)  # Assuming 2 sessions
+
+        # Nothing to rebuild if neither the options nor the layout changed,
+        # e.g. when switching to random and back to fixed
+        key = (tuple(task_options), tasks_per_session)
+        if key == self._sequence_inputs_key:
+            return
+        self._sequence_inputs_key = key
+
+        # Hide dropdowns that are no longer needed
+        needed = {(session, task_num) for session in sessions for task_num in range(tasks_per_session)}
+        for pool_key, (menu, _) in self._sequence_menu_pool.items():
+            if pool_key not in needed:
+                menu.grid_forget()
 
-        # Create dropdowns for 2 sessions
+        # Create dropdowns for 2 sessions, reusing existing widgets where possible
         self.sequence_vars = {}
 
-        for session in range(1, 3):  # Assuming 2 sessions
-            session_label = ctk.CTkLabel(
-                self.sequence_dropdowns_frame,
-                text=f"Session {session}:",
-                font=ctk.CTkFont(weight="bold")
-            )
+        for session in sessions:
+            session_label = self._sequence_session_labels.get(session)
+            if session_label is None:
+                session_label = ctk.CTkLabel(
+                    self.sequence_dropdowns_frame,
+                    text=f"Session {session}:",
+                    font=get_font(weight="bold")
+                )
+                self._sequence_session_labels[session] = session_label
             session_label.grid(row=session - 1, column=0, sticky="w", pady=10)
 
             self.sequence_vars[session] = []
 
             for task_num in range(tasks_per_session):
-                task_var = tk.StringVar()
-                self.sequence_vars[session].append(task_var)
+                pooled = self._sequence_menu_pool.get((session, task_num))
+                if pooled is None:
+                    task_var = tk.StringVar()
+                    task_var.trace_add("write", self._mark_config_dirty)
+                    task_menu = ctk.CTkOptionMenu(
+                        self.sequence_dropdowns_frame,
+                        variable=task_var,
+                        values=task_options,
+                        width=200
+                    )
+                    self._sequence_menu_pool[(session, task_num)] = (task_menu, task_var)
+                else:
+                    task_menu, task_var = pooled
+                    task_menu.configure(values=task_options)
+                    task_var.set("")
 
-                task_menu = ctk.CTkOptionMenu(
-                    self.sequence_dropdowns_frame,
-                    variable=task_var,
-                    values=task_options,
-                    width=200
-                )
+                self.sequence_vars[session].append(task_var)
                 task_menu.grid(row=session - 1, column=task_num + 1, padx=5, pady=5)
 
                 # If only one task per session, pre-select if only one task available
                 if tasks_per_session == 1 and len(task_options) == 1:
                     task_var.set(task_options[0])
 
+    def toggle_date_settings(self):
+        """Show or hide the date settings, building them on first use."""
+        if self.start_date_entry is None:
+            self._build_date_fields()
+        self.toggle_frame(self.date_frame)
+
     def toggle_frame(self, frame):
         """Toggle visibility of a frame."""
         if frame.winfo_viewable():
@@ -1079,42 +1383,65 @@ class ExperimentBuilder(ctk.CTkFrame):
         """Preview the experiment configuration."""
         try:
             config = self.build_experiment_config()
+            config_text = json.dumps(config, indent=2)
 
-            # Create preview window
-            preview_window = ctk.CTkToplevel(self)
-            preview_window.title("Configuration Preview")
-            preview_window.geometry("600x500")
-
-            # Title
-            title_label = ctk.CTkLabel(
-                preview_window,
-                text="Experiment Configuration Preview",
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            title_label.pack(pady=20)
+            # Reuse the preview window if it was opened before
+            if self._preview_window is None or not self._preview_window.winfo_exists():
+                self._create_preview_window()
 
-            # Config display
-            text_widget = ctk.CTkTextbox(preview_window, height=400)
-            text_widget.pack(fill="both", expand=True, padx=20, pady=10)
+            # Only rewrite the text when the configuration changed
+            if config_text != self._preview_shown:
+                self._preview_text.configure(state="normal")
+                self._preview_text.delete("1.0", "end")
+                self._preview_text.insert("1.0", config_text)
+                self._preview_text.configure(state="disabled")
+                self._preview_shown = config_text
 
-            # Format config as JSON
-            config_text = json.dumps(config, indent=2)
-            text_widget.insert("1.0", config_text)
-            text_widget.configure(state="disabled")
-
-            # Close button
-            close_btn = ctk.CTkButton(
-                preview_window,
-                text="Close",
-                command=preview_window.destroy
-            )
-            close_btn.pack(pady=10)
+            self._preview_window.deiconify()
+            self._preview_window.lift()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate preview: {e}")
 
+    def _create_preview_window(self):
+        """Create the configuration preview window, hidden rather than destroyed on close."""
+        preview_window = ctk.CTkToplevel(self)
+        preview_window.title("Configuration Preview")
+        preview_window.geometry("600x500")
+        preview_window.protocol("WM_DELETE_WINDOW", preview_window.withdraw)
+
+        # Title
+        title_label = ctk.CTkLabel(
+            preview_window,
+            text="Experiment Configuration Preview",
+            font=get_font(18, "bold")
+        )
+        title_label.pack(pady=20)
+
+        # Config display
+        text_widget = ctk.CTkTextbox(preview_window, height=400)
+        text_widget.pack(fill="both", expand=True, padx=20, pady=10)
+
+        # Close button
+        close_btn = ctk.CTkButton(
+            preview_window,
+            text="Close",
+            command=preview_window.withdraw
+        )
+        close_btn.pack(pady=10)
+
+        self._preview_window = preview_window
+        self._preview_text = text_widget
+        self._preview_shown = None
+
     def build_experiment_config(self) -> Dict:
-        """Build the experiment configuration with task instances."""
+        """Build the experiment configuration with task instances.
+
+        The result is cached and reused until the form changes.
+        """
+        if not self._config_dirty and self._cached_config is not None:
+            return self._cached_config
+
         # Validate and get values with defaults - using safe methods
         try:
             trials_str = self.trials_var.get().strip()
@@ -1133,15 +1460,16 @@ class ExperimentBuilder(ctk.CTkFrame):
             session_gap_days = 14
 
         tasks_per_session = self.safe_get_int(self.tasks_per_session_var, 2)
+        sequence_type = self.sequence_type_var.get()
 
-        # Get task instances and their configs
+        # Get task instances and their configs in a single pass. The standard
+        # tasks section (kept for compatibility) takes the config of the first
+        # instance of each task type, and its keys double as the enabled types.
         task_configs = {}
-        enabled_tasks = []
-        unique_task_types = set()
+        tasks_section = {}
 
         for instance_id, instance in self.task_instances.items():
             task_type = instance['task_type']
-            unique_task_types.add(task_type)
 
             # Add to task configs with instance ID as key
             task_configs[instance_id] = {
@@ -1149,16 +1477,9 @@ class ExperimentBuilder(ctk.CTkFrame):
                 'display_name': instance['display_name'],
                 **instance['config']  # Merge with custom config
             }
-            enabled_tasks.append(instance_id)
+            tasks_section.setdefault(task_type, instance['config'])
 
-        # Also create a standard tasks section for compatibility
-        tasks_section = {}
-        for task_type in unique_task_types:
-            # Find the first instance of this task type and use its config
-            for instance_id, instance in self.task_instances.items():
-                if instance['task_type'] == task_type:
-                    tasks_section[task_type] = instance['config']
-                    break
+        enabled_tasks = list(task_configs)
 
         config = {
             "experiment": {
@@ -1166,9 +1487,9 @@ class ExperimentBuilder(ctk.CTkFrame):
                 "session_gap_days": session_gap_days,
                 "tasks_per_session": tasks_per_session,
                 "enabled_task_instances": enabled_tasks,
-                "enabled_tasks": list(unique_task_types),  # Add this for compatibility
+                "enabled_tasks": list(tasks_section),  # Add this for compatibility
                 "task_sequence": {
-                    "type": self.sequence_type_var.get()
+                    "type": sequence_type
                 }
             },
             "display": {
@@ -1184,22 +1505,25 @@ class ExperimentBuilder(ctk.CTkFrame):
         }
 
         # Add fixed sequences if applicable
-        if self.sequence_type_var.get() == "fixed" and hasattr(self, 'sequence_vars'):
+        if sequence_type == "fixed":
+            # Map display names back to instance IDs (first match wins)
+            instance_by_display = {}
+            for inst_id, inst in self.task_instances.items():
+                instance_by_display.setdefault(inst['display_name'], inst_id)
+
             sequences = {}
             for session, vars in self.sequence_vars.items():
-                # Map display names back to instance IDs
                 task_sequence = []
                 for var in vars:
-                    display_name = var.get()
-                    # Find instance ID by display name
-                    for inst_id, inst in self.task_instances.items():
-                        if inst['display_name'] == display_name:
-                            task_sequence.append(inst_id)
-                            break
+                    inst_id = instance_by_display.get(var.get())
+                    if inst_id is not None:
+                        task_sequence.append(inst_id)
                 sequences[str(session)] = task_sequence
 
             config["experiment"]["task_sequence"]["sequences"] = sequences
 
+        self._cached_config = config
+        self._config_dirty = False
         return config
 
     def save_experiment(self):
@@ -1241,23 +1565,26 @@ class ExperimentBuilder(ctk.CTkFrame):
         start_date = None
         end_date = None
 
-        if self.start_date_var.get():
+        # The date entries only exist once the date settings have been opened
+        start_date_str = self.start_date_entry.get().strip() if self.start_date_entry else ""
+        if start_date_str:
             try:
-                start_date = datetime.strptime(self.start_date_var.get(), "%Y-%m-%d")
+                start_date = _parse_form_date(start_date_str)
             except ValueError:
                 messagebox.showerror("Error", "Invalid start date format. Use YYYY-MM-DD")
                 return
 
-        if self.end_date_var.get():
+        end_date_str = self.end_date_entry.get().strip() if self.end_date_entry else ""
+        if end_date_str:
             try:
-                end_date = datetime.strptime(self.end_date_var.get(), "%Y-%m-%d")
+                end_date = _parse_form_date(end_date_str)
             except ValueError:
                 messagebox.showerror("Error", "Invalid end date format. Use YYYY-MM-DD")
                 return
 
         # Parse max participants
         max_participants = None
-        max_part_str = self.max_participants_var.get().strip()
+        max_part_str = self.max_participants_entry.get().strip()
         if max_part_str:
             try:
                 max_participants = int(max_part_str)
@@ -1281,21 +1608,41 @@ class ExperimentBuilder(ctk.CTkFrame):
                 )
                 messagebox.showinfo("Success", "Experiment updated successfully!")
             else:
-                # Create new
-                self.db_manager.create_experiment(
-                    experiment_code=self.code_var.get().strip(),
-                    name=self.name_var.get().strip(),
-                    config=config,
-                    description=self.desc_text.get("1.0", "end-1c").strip(),
-                    start_date=start_date,
-                    end_date=end_date,
-                    max_participants=max_participants,
-                    created_by="Admin"
-                )
-                messagebox.showinfo("Success", "Experiment created successfully!")
+                # Create new. Uniqueness is enforced by the database; a generated
+                # code taken since it was shown is replaced, with the researcher's OK.
+                code = self.code_var.get().strip()
+                attempts = self.CODE_RETRY_ATTEMPTS if code == self._generated_code else 1
+                for attempt in range(attempts):
+                    try:
+                        self.db_manager.create_experiment(
+                            experiment_code=code,
+                            name=self.name_var.get().strip(),
+                            config=config,
+                            description=self.desc_text.get("1.0", "end-1c").strip(),
+                            start_date=start_date,
+                            end_date=end_date,
+                            max_participants=max_participants,
+                            created_by="Admin"
+                        )
+                        break
+                    except ValueError:
+                        if attempt == attempts - 1:
+                            raise
+                        taken = code
+                        code = self._generated_code = _new_experiment_code(
+                            self.db_manager.get_existing_experiment_codes()
+                        )
+                        self.code_var.set(code)
+                        if not messagebox.askyesno(
+                            "Code Taken",
+                            f"Experiment code {taken} has been used by another experiment.\n\n"
+                            f"Save this experiment as {code} instead?"
+                        ):
+                            return
+                messagebox.showinfo("Success", f"Experiment {code} created successfully!")
 
             # Refresh and go back to list
-            self.refresh()
+            self.schedule_refresh()
             self.notebook.select(0)
 
         except Exception as e:
@@ -1312,16 +1659,17 @@ class ExperimentBuilder(ctk.CTkFrame):
             self.desc_text.insert("1.0", experiment['description'])
 
         # Dates
+        # Dates are stored as ISO text; the YYYY-MM-DD part is the first 10 chars
+        if (experiment['start_date'] or experiment['end_date']) and self.start_date_entry is None:
+            self._build_date_fields()
         if experiment['start_date']:
-            start_date = datetime.fromisoformat(experiment['start_date'])
-            self.start_date_var.set(start_date.strftime("%Y-%m-%d"))
+            self.set_entry_text(self.start_date_entry, experiment['start_date'][:10])
         if experiment['end_date']:
-            end_date = datetime.fromisoformat(experiment['end_date'])
-            self.end_date_var.set(end_date.strftime("%Y-%m-%d"))
+            self.set_entry_text(self.end_date_entry, experiment['end_date'][:10])
 
         # Max participants
         if experiment['max_participants']:
-            self.max_participants_var.set(str(experiment['max_participants']))
+            self.set_entry_text(self.max_participants_entry, str(experiment['max_participants']))
 
         # Load config
         config = experiment['config']
@@ -1330,52 +1678,61 @@ class ExperimentBuilder(ctk.CTkFrame):
         # Parameters - convert to strings for StringVar
         self.trials_var.set(str(exp_config.get('total_trials_per_task', 30)))
         self.gap_var.set(str(exp_config.get('session_gap_days', 14)))
-        self.tasks_per_session_var.set(exp_config.get('tasks_per_session', 2))
-
-        # Clear existing task instances
-        self.task_instances = {}
-        self.next_instance_id = 1
-        for widget in self.task_list_frame.winfo_children():
-            widget.destroy()
-
-        # Load task instances if new format
-        if 'task_instances' in config:
-            # New format with instances
-            for instance_id, instance_config in config['task_instances'].items():
-                self.task_instances[instance_id] = {
-                    'task_type': instance_config['task_type'],
-                    'display_name': instance_config.get('display_name',
-                                                        TaskType.get_display_name(
-                                                            TaskType(instance_config['task_type']))),
-                    'config': {k: v for k, v in instance_config.items()
-                               if k not in ['task_type', 'display_name']}
-                }
-                self.create_task_instance_ui(instance_id)
-        else:
-            # Legacy format - convert to instances
-            # This maintains backward compatibility
-            enabled_tasks = exp_config.get('enabled_tasks', [])
-            task_configs = config.get('tasks', {})
-
-            for task_type in enabled_tasks:
-                instance_id = f"task_{self.next_instance_id}"
-                self.next_instance_id += 1
-
-                self.task_instances[instance_id] = {
-                    'task_type': task_type,
-                    'display_name': TaskType.get_display_name(TaskType(task_type)),
-                    'config': task_configs.get(task_type, {})
-                }
-                self.create_task_instance_ui(instance_id)
 
-        # Sequence type
-        sequence_config = exp_config.get('task_sequence', {})
-        self.sequence_type_var.set(sequence_config.get('type', 'random'))
-        self.on_sequence_type_change()
-
-        # Load fixed sequences if applicable
-        if sequence_config.get('type') == 'fixed' and 'sequences' in sequence_config:
-            # Update the dropdowns with saved sequences
+        # Hold back sequence input rebuilds until every task instance is loaded
+        self._sequence_updates_suspended = True
+        try:
+            self.tasks_per_session_var.set(exp_config.get('tasks_per_session', 2))
+
+            # Clear existing task instances
+            self.clear_task_instances()
+
+            # Load task instances if new format
+            if 'task_instances' in config:
+                # New format with instances
+                for instance_id, instance_config in config['task_instances'].items():
+                    self.task_instances[instance_id] = {
+                        'task_type': instance_config['task_type'],
+                        'display_name': instance_config.get('display_name',
+                                                            _TASK_DISPLAY[instance_config['task_type']]),
+                        'config': {k: v for k, v in instance_config.items()
+                                   if k not in ['task_type', 'display_name']}
+                    }
+            else:
+                # Legacy format - convert to instances
+                # This maintains backward compatibility
+                enabled_tasks = exp_config.get('enabled_tasks', [])
+                task_configs = config.get('tasks', {})
+
+                for task_type in enabled_tasks:
+                    instance_id = f"task_{self.next_instance_id}"
+                    self.next_instance_id += 1
+
+                    self.task_instances[instance_id] = {
+                        'task_type': task_type,
+                        'display_name': _TASK_DISPLAY[task_type],
+                        'config': task_configs.get(task_type, {})
+                    }
+
+            for instance in self.task_instances.values():
+                task_type = instance['task_type']
+                self._task_type_counts[task_type] = self._task_type_counts.get(task_type, 0) + 1
+
+            # Build all task cards first, then pack them in one pass
+            for instance_id in self.task_instances:
+                self.create_task_instance_ui(instance_id, pack=False)
+            for instance in self.task_instances.values():
+                instance['ui_card'].pack(fill="x", pady=5)
+
+            # Sequence type
+            sequence_config = exp_config.get('task_sequence', {})
+            self.sequence_type_var.set(sequence_config.get('type', 'random'))
+            self.on_sequence_type_change()
+        finally:
+            self._sequence_updates_suspended = False
+
+        # Build the sequence dropdowns once for the loaded tasks
+        if self.sequence_type_var.get() == "fixed":
             self.update_sequence_inputs()
             # TODO: Populate the sequence dropdowns with saved values
 
@@ -1385,9 +1742,10 @@ class ExperimentBuilder(ctk.CTkFrame):
         self.code_entry.configure(state="normal")
         self.name_var.set("")
         self.desc_text.delete("1.0", "end")
-        self.start_date_var.set("")
-        self.end_date_var.set("")
-        self.max_participants_var.set("")
+        if self.start_date_entry is not None:
+            self.set_entry_text(self.start_date_entry, "")
+            self.set_entry_text(self.end_date_entry, "")
+        self.set_entry_text(self.max_participants_entry, "")
 
         # Reset to defaults as strings
         self.trials_var.set("30")
@@ -1395,10 +1753,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         self.tasks_per_session_var.set(2)
 
         # Clear task instances
-        self.task_instances = {}
-        self.next_instance_id = 1
-        for widget in self.task_list_frame.winfo_children():
-            widget.destroy()
+        self.clear_task_instances()
 
         self.sequence_type_var.set("random")
         self.on_sequence_type_change()
@@ -1412,36 +1767,31 @@ class ExperimentBuilder(ctk.CTkFrame):
         max_pumps_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(max_pumps_frame, text="Max pumps:", width=150, anchor="w").pack(side="left")
-        max_pumps_var = tk.StringVar()
-        widgets['max_pumps'] = max_pumps_var
-        ctk.CTkEntry(max_pumps_frame, textvariable=max_pumps_var, width=100,
-                     placeholder_text="e.g., 48").pack(side="left")
+        max_pumps_entry = ctk.CTkEntry(max_pumps_frame, width=100, placeholder_text="e.g., 48")
+        max_pumps_entry.pack(side="left")
+        widgets['max_pumps'] = max_pumps_entry
 
         # Points per pump
         points_frame = ctk.CTkFrame(parent)
         points_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(points_frame, text="Points per pump:", width=150, anchor="w").pack(side="left")
-        points_var = tk.StringVar()
-        widgets['points_per_pump'] = points_var
-        ctk.CTkEntry(points_frame, textvariable=points_var, width=100,
-                     placeholder_text="e.g., 5").pack(side="left")
+        points_entry = ctk.CTkEntry(points_frame, width=100, placeholder_text="e.g., 5")
+        points_entry.pack(side="left")
+        widgets['points_per_pump'] = points_entry
 
         # Explosion range
         range_frame = ctk.CTkFrame(parent)
         range_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(range_frame, text="Explosion range:", width=150, anchor="w").pack(side="left")
-        min_var = tk.StringVar()
-        max_var = tk.StringVar()
-        widgets['explosion_min'] = min_var
-        widgets['explosion_max'] = max_var
-
-        ctk.CTkEntry(range_frame, textvariable=min_var, width=45,
-                     placeholder_text="Min").pack(side="left", padx=2)
+        min_entry = ctk.CTkEntry(range_frame, width=45, placeholder_text="Min")
+        min_entry.pack(side="left", padx=2)
         ctk.CTkLabel(range_frame, text="-").pack(side="left")
-        ctk.CTkEntry(range_frame, textvariable=max_var, width=45,
-                     placeholder_text="Max").pack(side="left", padx=2)
+        max_entry = ctk.CTkEntry(range_frame, width=45, placeholder_text="Max")
+        max_entry.pack(side="left", padx=2)
+        widgets['explosion_min'] = min_entry
+        widgets['explosion_max'] = max_entry
 
         # Keyboard mode
         keyboard_frame = ctk.CTkFrame(parent)
@@ -1479,20 +1829,18 @@ class ExperimentBuilder(ctk.CTkFrame):
         max_fish_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(max_fish_frame, text="Max fish:", width=150, anchor="w").pack(side="left")
-        max_fish_var = tk.StringVar()
-        widgets['max_fish'] = max_fish_var
-        ctk.CTkEntry(max_fish_frame, textvariable=max_fish_var, width=100,
-                     placeholder_text="e.g., 64").pack(side="left")
+        max_fish_entry = ctk.CTkEntry(max_fish_frame, width=100, placeholder_text="e.g., 64")
+        max_fish_entry.pack(side="left")
+        widgets['max_fish'] = max_fish_entry
 
         # Points per fish
         points_frame = ctk.CTkFrame(parent)
         points_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(points_frame, text="Points per fish:", width=150, anchor="w").pack(side="left")
-        points_var = tk.StringVar()
-        widgets['points_per_fish'] = points_var
-        ctk.CTkEntry(points_frame, textvariable=points_var, width=100,
-                     placeholder_text="e.g., 5").pack(side="left")
+        points_entry = ctk.CTkEntry(points_frame, width=100, placeholder_text="e.g., 5")
+        points_entry.pack(side="left")
+        widgets['points_per_fish'] = points_entry
 
     def _create_mining_overrides(self, parent, widgets):
         """Create Mountain Mining-specific override controls."""
@@ -1501,20 +1849,18 @@ class ExperimentBuilder(ctk.CTkFrame):
         max_ore_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(max_ore_frame, text="Max ore:", width=150, anchor="w").pack(side="left")
-        max_ore_var = tk.StringVar()
-        widgets['max_ore'] = max_ore_var
-        ctk.CTkEntry(max_ore_frame, textvariable=max_ore_var, width=100,
-                     placeholder_text="e.g., 64").pack(side="left")
+        max_ore_entry = ctk.CTkEntry(max_ore_frame, width=100, placeholder_text="e.g., 64")
+        max_ore_entry.pack(side="left")
+        widgets['max_ore'] = max_ore_entry
 
         # Points per ore
         points_frame = ctk.CTkFrame(parent)
         points_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(points_frame, text="Points per ore:", width=150, anchor="w").pack(side="left")
-        points_var = tk.StringVar()
-        widgets['points_per_ore'] = points_var
-        ctk.CTkEntry(points_frame, textvariable=points_var, width=100,
-                     placeholder_text="e.g., 5").pack(side="left")
+        points_entry = ctk.CTkEntry(points_frame, width=100, placeholder_text="e.g., 5")
+        points_entry.pack(side="left")
+        widgets['points_per_ore'] = points_entry
 
     def _create_stb_overrides(self, parent, widgets):
         """Create Spinning Bottle-specific override controls."""
@@ -1534,26 +1880,22 @@ class ExperimentBuilder(ctk.CTkFrame):
         points_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(points_frame, text="Points per add:", width=150, anchor="w").pack(side="left")
-        points_var = tk.StringVar()
-        widgets['points_per_add'] = points_var
-        ctk.CTkEntry(points_frame, textvariable=points_var, width=100,
-                     placeholder_text="e.g., 5").pack(side="left")
+        points_entry = ctk.CTkEntry(points_frame, width=100, placeholder_text="e.g., 5")
+        points_entry.pack(side="left")
+        widgets['points_per_add'] = points_entry
 
         # Spin speed range
         speed_frame = ctk.CTkFrame(parent)
         speed_frame.pack(fill="x", pady=5)
 
         ctk.CTkLabel(speed_frame, text="Speed range:", width=150, anchor="w").pack(side="left")
-        min_speed_var = tk.StringVar()
-        max_speed_var = tk.StringVar()
-        widgets['speed_min'] = min_speed_var
-        widgets['speed_max'] = max_speed_var
-
-        ctk.CTkEntry(speed_frame, textvariable=min_speed_var, width=45,
-                     placeholder_text="Min").pack(side="left", padx=2)
+        min_speed_entry = ctk.CTkEntry(speed_frame, width=45, placeholder_text="Min")
+        min_speed_entry.pack(side="left", padx=2)
         ctk.CTkLabel(speed_frame, text="-").pack(side="left")
-        ctk.CTkEntry(speed_frame, textvariable=max_speed_var, width=45,
-                     placeholder_text="Max").pack(side="left", padx=2)
+        max_speed_entry = ctk.CTkEntry(speed_frame, width=45, placeholder_text="Max")
+        max_speed_entry.pack(side="left", padx=2)
+        widgets['speed_min'] = min_speed_entry
+        widgets['speed_max'] = max_speed_entry
 
         # Win color
         win_color_frame = ctk.CTkFrame(parent)
@@ -1583,50 +1925,97 @@ class ExperimentBuilder(ctk.CTkFrame):
         self.refresh_experiments()
 
     def refresh_experiments(self):
-        """Refresh the experiment list."""
-        # Clear tree
-        for item in self.exp_tree.get_children():
-            self.exp_tree.delete(item)
+        """Refresh the experiment list, keeping as many rows as are already loaded."""
+        self._last_exp_version = self.db_manager.experiments_version
+        page_size = max(self._loaded_rows, self.EXPERIMENT_PAGE_SIZE)
+        self._run_db_query(
+            partial(self._on_experiments_loaded, page_size, False),
+            'get_active_experiments',
+            limit=page_size
+        )
+
+    def schedule_refresh(self):
+        """Refresh the experiment list after local writes.
+
+        Back-to-back calls collapse into one refresh, which is skipped entirely
+        if no experiment changed since the list was last loaded.
+        """
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(self.REFRESH_DEBOUNCE_MS, self._refresh_if_changed)
+
+    def _refresh_if_changed(self):
+        """Run a scheduled refresh if the experiments table has changed."""
+        self._refresh_after_id = None
+        if self.db_manager.experiments_version != self._last_exp_version:
+            self.refresh_experiments()
+
+    def load_more_experiments(self):
+        """Append the next page of experiments to the list."""
+        self._run_db_query(
+            partial(self._on_experiments_loaded, self.EXPERIMENT_PAGE_SIZE, True),
+            'get_active_experiments',
+            offset=self._loaded_rows,
+            limit=self.EXPERIMENT_PAGE_SIZE
+        )
 
-        # Get experiments
-        experiments = self.db_manager.get_active_experiments()
+    def _on_experiments_loaded(self, page_size: int, append: bool, experiments: List[Dict]):
+        """Show a page of experiments fetched in the background."""
+        self._sync_experiment_rows(experiments, append=append)
+        self.load_more_btn.configure(state="normal" if len(experiments) == page_size else "disabled")
 
+    def _sync_experiment_rows(self, experiments: List[Dict], append: bool = False):
+        """Update the experiment tree in place, touching only rows that changed."""
+        rows = {}
         for exp in experiments:
-            created_date = datetime.fromisoformat(exp['created_date'])
             status = "Active" if exp['is_active'] else "Inactive"
 
-            self.exp_tree.insert(
-                "",
-                "end",
-                values=(
-                    exp['experiment_code'],
-                    exp['name'],
-                    f"{exp['enrolled_count']}/{exp['max_participants'] or '∞'}",
-                    status,
-                    created_date.strftime("%Y-%m-%d")
-                ),
-                tags=(exp['id'],)
+            rows[str(exp['id'])] = (
+                exp['experiment_code'],
+                exp['name'],
+                f"{exp['enrolled_count']}/{exp['max_participants'] or '∞'}",
+                status,
+                exp['created_date'][:10]  # Stored as ISO text, so the date is the first 10 chars
             )
 
+        if not append:
+            # Drop rows that are no longer in the list
+            stale = [iid for iid in self._exp_row_values if iid not in rows]
+            if stale:
+                self.exp_tree.delete(*stale)
+                for iid in stale:
+                    del self._exp_row_values[iid]
+
+        for iid, values in rows.items():
+            if iid not in self._exp_row_values:
+                self.exp_tree.insert("", "end", iid=iid, values=values, tags=(int(iid),))
+            elif self._exp_row_values[iid] != values:
+                self.exp_tree.item(iid, values=values)
+            self._exp_row_values[iid] = values
+
+        if not append:
+            # Restore query order only if it no longer matches the tree
+            order = tuple(rows)
+            if self.exp_tree.get_children() != order:
+                for index, iid in enumerate(order):
+                    self.exp_tree.move(iid, "", index)
+
+        self._loaded_rows = len(self._exp_row_values)
+
     def on_experiment_select(self, event):
         """Handle experiment selection."""
-        selection = self.exp_tree.selection()
-        if selection:
-            # Enable action buttons
-            self.edit_btn.configure(state="normal")
-            self.duplicate_btn.configure(state="normal")
-            self.toggle_btn.configure(state="normal")
-            self.view_stats_btn.configure(state="normal")
-        else:
-            # Disable action buttons
-            self.edit_btn.configure(state="disabled")
-            self.duplicate_btn.configure(state="disabled")
-            self.toggle_btn.configure(state="disabled")
-            self.view_stats_btn.configure(state="disabled")
+        state = "normal" if self.exp_tree.selection() else "disabled"
+
+        # Only touch the buttons when their state actually changes
+        if state != self._action_btn_state:
+            for button in self._action_buttons:
+                button.configure(state=state)
+            self._action_btn_state = state
 
     def new_experiment(self):
         """Create a new experiment."""
         self.current_experiment_id = None
+        self.ensure_tab_built(1)
         self.clear_builder_form()
         self.notebook.select(1)  # Switch to builder tab
 
@@ -1640,9 +2029,10 @@ class ExperimentBuilder(ctk.CTkFrame):
         experiment_id = item['tags'][0]
 
         # Load experiment data
-        experiment = self.db_manager.get_experiment(experiment_id=experiment_id)
+        experiment = self.get_experiment(experiment_id)
         if experiment:
             self.current_experiment_id = experiment_id
+            self.ensure_tab_built(1)
             self.load_experiment_to_form(experiment)
             self.notebook.select(1)  # Switch to builder tab
 
@@ -1660,29 +2050,21 @@ class ExperimentBuilder(ctk.CTkFrame):
         item = self.exp_tree.item(selection[0])
         experiment_id = item['tags'][0]
 
-        # Load experiment
-        experiment = self.db_manager.get_experiment(experiment_id=experiment_id)
-        if experiment:
-            # Generate new code
-            self.generate_experiment_code()
-            new_code = self.code_var.get()
-
-            # Create duplicate
-            try:
-                self.db_manager.create_experiment(
-                    experiment_code=new_code,
-                    name=f"{experiment['name']} (Copy)",
-                    config=experiment['config'],
-                    description=experiment['description'],
-                    max_participants=experiment['max_participants'],
-                    created_by="Admin"
-                )
-
-                messagebox.showinfo("Success", f"Experiment duplicated with code: {new_code}")
-                self.refresh()
+        # Read, pick a new code and copy in one transaction
+        try:
+            result = self.db_manager.duplicate_experiment(
+                experiment_id,
+                _new_experiment_code,
+                created_by="Admin"
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to duplicate experiment: {e}")
+            return
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to duplicate experiment: {e}")
+        if result:
+            _, new_code = result
+            messagebox.showinfo("Success", f"Experiment duplicated with code: {new_code}")
+            self.schedule_refresh()
 
     def toggle_active(self):
         """Toggle active status of selected experiment."""
@@ -1694,7 +2076,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         experiment_id = item['tags'][0]
 
         # Get current status
-        experiment = self.db_manager.get_experiment(experiment_id=experiment_id)
+        experiment = self.get_experiment(experiment_id)
         if experiment:
             new_status = not experiment['is_active']
 
@@ -1706,7 +2088,7 @@ class ExperimentBuilder(ctk.CTkFrame):
 
                 status_text = "activated" if new_status else "deactivated"
                 messagebox.showinfo("Success", f"Experiment {status_text}")
-                self.refresh()
+                self.schedule_refresh()
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update experiment: {e}")
@@ -1721,6 +2103,7 @@ class ExperimentBuilder(ctk.CTkFrame):
         experiment_id = item['tags'][0]
 
         # Switch to analytics tab and load stats
+        self.ensure_tab_built(2)
         self.load_experiment_analytics(experiment_id)
         self.notebook.select(2)
 
@@ -1730,59 +2113,57 @@ class ExperimentBuilder(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self.analytics_frame,
             text="Experiment Analytics",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         title_label.pack(pady=20)
 
         # Stats display
-        self.stats_text = ctk.CTkTextbox(self.analytics_frame, height=500)
+        self.stats_text = ctk.CTkTextbox(self.analytics_frame, height=500, state="disabled")
         self.stats_text.pack(fill="both", expand=True, padx=20, pady=10)
 
     def load_experiment_analytics(self, experiment_id: int):
-        """Load analytics for an experiment."""
-        experiment = self.db_manager.get_experiment(experiment_id=experiment_id)
-        stats = self.db_manager.get_experiment_statistics(experiment_id)
+        """Load analytics for an experiment in the background."""
+        self._run_db_query(self._show_experiment_analytics, 'get_experiment_with_statistics', experiment_id)
 
-        # Clear text
-        self.stats_text.delete("1.0", "end")
-
-        # Build analytics report
-        report = []
-        report.append(f"Experiment: {experiment['name']}")
-        report.append(f"Code: {experiment['experiment_code']}")
-        report.append(f"Status: {'Active' if experiment['is_active'] else 'Inactive'}")
-        report.append("")
+    def _show_experiment_analytics(self, result: Tuple[Optional[Dict], Dict]):
+        """Render the analytics report for a loaded experiment."""
+        experiment, stats = result
+        if not experiment:
+            return
 
-        report.append("=== Enrollment Statistics ===")
-        report.append(f"Total Participants: {stats['participant_count']}")
-        report.append(f"Total Sessions: {stats['session_count']}")
-        report.append(f"Completed Sessions: {stats['completed_sessions']}")
+        # Clear text; the box is kept read-only between reports
+        text = self.stats_text
+        text.configure(state="normal")
+        text.delete("1.0", "end")
+
+        # Write the report straight into the widget, one section at a time
+        text.insert("end",
+                    f"Experiment: {experiment['name']}\n"
+                    f"Code: {experiment['experiment_code']}\n"
+                    f"Status: {'Active' if experiment['is_active'] else 'Inactive'}\n"
+                    "\n"
+                    "=== Enrollment Statistics ===\n"
+                    f"Total Participants: {stats['participant_count']}\n"
+                    f"Total Sessions: {stats['session_count']}\n"
+                    f"Completed Sessions: {stats['completed_sessions']}\n")
 
         if stats['session_count'] > 0:
             completion_rate = (stats['completed_sessions'] / stats['session_count']) * 100
-            report.append(f"Completion Rate: {completion_rate:.1f}%")
+            text.insert("end", f"Completion Rate: {completion_rate:.1f}%\n")
 
-        report.append("")
-        report.append("=== Task Statistics ===")
+        text.insert("end", "\n=== Task Statistics ===\n")
 
         for task_name, task_stats in stats['task_statistics'].items():
-            display_name = TaskType.get_display_name(TaskType(task_name))
-            report.append(f"\n{display_name}:")
-            report.append(f"  Trials: {task_stats['trial_count']}")
-            report.append(f"  Avg Risk Level: {task_stats['avg_risk']:.3f}")
-            report.append(f"  Avg Points: {task_stats['avg_points']:.1f}")
-            report.append(f"  Success Rate: {task_stats['success_rate'] * 100:.1f}%")
+            display_name = _TASK_DISPLAY.get(task_name, task_name)
+            text.insert("end", _TASK_STATS_TEMPLATE.format(display_name=display_name, **task_stats))
 
-        self.stats_text.insert("1.0", "\n".join(report))
+        text.configure(state="disabled")
 
     def generate_experiment_code(self):
-        """Generate a unique experiment code."""
-        # Generate format: EXP + random 3-digit number + random letter
-        while True:
-            code = f"EXP{random.randint(100, 999)}{random.choice(string.ascii_uppercase)}"
-
-            # Check if code already exists
-            existing = self.db_manager.get_experiment(experiment_code=code)
-            if not existing:
-                self.code_var.set(code)
-                break
\ No newline at end of file
+        """Generate an experiment code no saved experiment uses.
+
+        Another experiment may still claim it before this one is saved; the
+        database's UNIQUE constraint catches that when saving.
+        """
+        self._generated_code = _new_experiment_code(self.db_manager.get_existing_experiment_codes())
+        self.code_var.set(self._generated_code)
\ No newline at end of file
@@ -7,20 +7,52 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import customtkinter as ctk
 from datetime import datetime
-import re
+from functools import lru_cache
+import string
 from typing import Optional, Callable
 
 from database.db_manager import DatabaseManager
 from database.models import Participant, Gender
+from utils.task_scheduler import TaskScheduler
+from utils.fonts import get_font
+
+# Deletes every character allowed in participant codes (letters, digits,
+# hyphens and underscores), so anything left over is invalid
+_CODE_CHARS_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+
+# Display names for stored gender values, and the gender menu choices
+_GENDER_DISPLAY = {g.value: g.value.replace("_", " ").title() for g in Gender}
+_GENDER_MENU_VALUES = ["Not specified"] + list(_GENDER_DISPLAY.values())
+
+
+@lru_cache(maxsize=4096)
+def _format_date(iso_date: str, fmt: str) -> str:
+    """Reformat a stored ISO timestamp, reusing earlier results for the same input."""
+    return datetime.fromisoformat(iso_date).strftime(fmt)
+
 
 class ParticipantManager(ctk.CTkFrame):
     """UI component for managing participants."""
 
+    # Keystrokes in the search box within this many ms trigger a single refresh
+    SEARCH_DEBOUNCE_MS = 200
+
     def __init__(self, parent, db_manager: DatabaseManager):
         super().__init__(parent)
         self.db_manager = db_manager
         self.selected_participant_id = None
 
+        # Pending search refresh, if any
+        self._search_after_id = None
+
+        # Rows from the last database load, in load order, and the (lowercased)
+        # search term they were loaded with; searches that extend that term
+        # hide and restore these rows instead of querying again
+        self._row_items = {}  # {participant id: tree iid}
+        self._row_codes = {}  # {participant id: lowercased participant code}
+        self._hidden_rows = set()  # iids currently detached from the tree
+        self._loaded_search = None
+
         # Setup UI
         self.setup_ui()
 
@@ -33,7 +65,7 @@ class ParticipantManager(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Participant Management",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=20)
 
@@ -111,7 +143,7 @@ class ParticipantManager(ctk.CTkFrame):
         details_label = ctk.CTkLabel(
             right_frame,
             text="Participant Details",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         details_label.pack(pady=10)
 
@@ -151,7 +183,7 @@ class ParticipantManager(ctk.CTkFrame):
         self.gender_menu = ctk.CTkOptionMenu(
             form_frame,
             variable=self.gender_var,
-            values=["Not specified"] + [g.value.replace("_", " ").title() for g in Gender]
+            values=_GENDER_MENU_VALUES
         )
         self.gender_menu.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
 
@@ -208,7 +240,7 @@ class ParticipantManager(ctk.CTkFrame):
         session_label = ctk.CTkLabel(
             self.session_frame,
             text="Session Information",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         session_label.pack(pady=5)
 
@@ -225,39 +257,34 @@ class ParticipantManager(ctk.CTkFrame):
         self.stats_label = ctk.CTkLabel(
             stats_frame,
             text="Loading statistics...",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         self.stats_label.pack(pady=10)
 
     def refresh(self):
-        """Refresh the participant list."""
-        # Clear current items
-        for item in self.participant_tree.get_children():
-            self.participant_tree.delete(item)
-
-        # Get all participants
-        participants = self.db_manager.get_all_participants()
-
-        # Filter by search term
-        search_term = self.search_var.get().lower()
-        if search_term:
-            participants = [
-                p for p in participants
-                if search_term in p['participant_code'].lower()
-            ]
+        """Reload the participant list from the database."""
+        # Clear the previous rows, including any hidden by a search, in a single call
+        if self._row_items:
+            self.participant_tree.delete(*self._row_items.values())
+        self._row_items = {}
+        self._row_codes = {}
+        self._hidden_rows = set()
+
+        # Get the participants matching the search term, filtered by the database
+        search_term = self.search_var.get()
+        participants = self.db_manager.get_all_participants(search_term or None)
+        self._loaded_search = search_term.lower()
 
         # Add to tree
         for participant in participants:
-            created_date = datetime.fromisoformat(participant['created_date'])
-            created_str = created_date.strftime("%Y-%m-%d")
+            created_str = _format_date(participant['created_date'], "%Y-%m-%d")
 
-            gender_display = participant['gender'] or "Not specified"
-            if gender_display in [g.value for g in Gender]:
-                gender_display = gender_display.replace("_", " ").title()
+            gender = participant['gender'] or "Not specified"
+            gender_display = _GENDER_DISPLAY.get(gender, gender)
 
             sessions_display = f"{participant['completed_sessions']}/{participant['session_count']}"
 
-            self.participant_tree.insert(
+            iid = self.participant_tree.insert(
                 "",
                 "end",
                 values=(
@@ -269,6 +296,8 @@ class ParticipantManager(ctk.CTkFrame):
                 ),
                 tags=(participant['id'],)
             )
+            self._row_items[participant['id']] = iid
+            self._row_codes[participant['id']] = participant['participant_code'].lower()
 
         # Update statistics
         self.update_statistics()
@@ -276,11 +305,10 @@ class ParticipantManager(ctk.CTkFrame):
     def update_statistics(self):
         """Update the statistics display."""
         stats = self.db_manager.get_statistics()
-        participants = self.db_manager.get_all_participants()
 
         # Calculate additional statistics
         total_participants = stats['total_participants']
-        active_participants = len([p for p in participants if p['session_count'] > 0])
+        active_participants = stats['active_participants']
 
         stats_text = (
             f"Total Participants: {total_participants} | "
@@ -291,9 +319,46 @@ class ParticipantManager(ctk.CTkFrame):
 
         self.stats_label.configure(text=stats_text)
 
+    def destroy(self):
+        """Cancel any pending search refresh before destroying the widget."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        super().destroy()
+
     def on_search(self, *args):
-        """Handle search input change."""
-        self.refresh()
+        """Handle search input change, refreshing once typing pauses."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        """Apply the search scheduled by on_search.
+
+        A term that extends the one the rows were loaded with can only match
+        fewer of them, so those rows are filtered in place; anything else
+        reloads from the database.
+        """
+        self._search_after_id = None
+        search_term = self.search_var.get().lower()
+        if self._loaded_search is not None and search_term.startswith(self._loaded_search):
+            self.filter_rows(search_term)
+        else:
+            self.refresh()
+
+    def filter_rows(self, search_term: str):
+        """Show only the loaded rows whose code contains search_term."""
+        tree = self.participant_tree
+        index = 0
+        for participant_id, iid in self._row_items.items():
+            if search_term in self._row_codes[participant_id]:
+                # Put a hidden row back at its place among the visible ones
+                if iid in self._hidden_rows:
+                    tree.move(iid, "", index)
+                    self._hidden_rows.discard(iid)
+                index += 1
+            elif iid not in self._hidden_rows:
+                tree.detach(iid)
+                self._hidden_rows.add(iid)
 
     def on_participant_select(self, event):
         """Handle participant selection from list."""
@@ -324,7 +389,7 @@ class ParticipantManager(ctk.CTkFrame):
             self.age_var.set(str(participant['age']))
 
         if participant['gender']:
-            gender_display = participant['gender'].replace("_", " ").title()
+            gender_display = _GENDER_DISPLAY.get(participant['gender'], participant['gender'])
             self.gender_var.set(gender_display)
         else:
             self.gender_var.set("Not specified")
@@ -349,7 +414,7 @@ class ParticipantManager(ctk.CTkFrame):
         else:
             info_lines = []
             for session in sessions:
-                session_date = datetime.fromisoformat(session['session_date'])
+                session_date = _format_date(session['session_date'], '%Y-%m-%d %H:%M')
                 status = "Completed" if session['completed'] else "Pending"
                 tasks = ", ".join([
                     task.replace("_", " ").title()
@@ -358,7 +423,7 @@ class ParticipantManager(ctk.CTkFrame):
 
                 info_lines.append(
                     f"Session {session['session_number']}: {status}\n"
-                    f"  Date: {session_date.strftime('%Y-%m-%d %H:%M')}\n"
+                    f"  Date: {session_date}\n"
                     f"  Tasks: {tasks}\n"
                     f"  Trials: {session['trial_count']}"
                 )
@@ -390,7 +455,7 @@ class ParticipantManager(ctk.CTkFrame):
             return False, "Participant code is required"
 
         # Validate code format (alphanumeric and hyphens/underscores)
-        if not re.match(r'^[A-Za-z0-9_-]+$', code):
+        if code.translate(_CODE_CHARS_TABLE):
             return False, "Participant code can only contain letters, numbers, hyphens, and underscores"
 
         # Check age if provided
@@ -511,11 +576,11 @@ class ParticipantManager(ctk.CTkFrame):
             return
 
         # Check if participant has sessions
-        sessions = self.db_manager.get_participant_sessions(self.selected_participant_id)
+        session_count = self.db_manager.get_participant_session_count(self.selected_participant_id)
 
         warning_msg = f"Are you sure you want to delete participant '{participant['participant_code']}'?"
-        if sessions:
-            warning_msg += f"\n\nThis participant has {len(sessions)} session(s) with data."
+        if session_count:
+            warning_msg += f"\n\nThis participant has {session_count} session(s) with data."
             warning_msg += "\nAll associated data will be permanently deleted!"
 
         result = messagebox.askyesno(
@@ -529,8 +594,8 @@ class ParticipantManager(ctk.CTkFrame):
                 # Delete participant and all associated data
                 self.db_manager.delete_participant(self.selected_participant_id)
 
-                # Also remove task assignments
-                from utils.task_scheduler import TaskScheduler
+                # Also remove task assignments; the scheduler is created here so
+                # it works on the assignments file as it is now
                 task_scheduler = TaskScheduler()
                 task_scheduler.reset_participant_assignments(self.selected_participant_id)
 
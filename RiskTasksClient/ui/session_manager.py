@@ -12,6 +12,10 @@ from pathlib import Path
 
 from database.db_manager import DatabaseManager
 from database.models import TaskType
+from utils.fonts import get_font
+
+# Abbreviated task names for the progress column, keyed by task type value
+_TASK_SHORT_NAMES = {task.value: TaskType.get_display_name(task)[:10] for task in TaskType}
 
 
 class SessionMonitor(ctk.CTkFrame):
@@ -22,6 +26,17 @@ class SessionMonitor(ctk.CTkFrame):
         self.db_manager = db_manager
         self.current_session_id = None
 
+        # Values currently shown per tree row, keyed by session id (the row iid)
+        self._session_row_values = {}
+
+        # Session details window, created on first use and withdrawn when closed
+        self._details_window = None
+        self._details_text = None
+        self._details_shown = None  # Text currently displayed
+
+        # Pending auto-refresh callback, if any
+        self.refresh_job = None
+
         self.setup_ui()
         self.refresh()
 
@@ -31,7 +46,7 @@ class SessionMonitor(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Session Monitor",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=20)
 
@@ -98,7 +113,7 @@ class SessionMonitor(ctk.CTkFrame):
             label = ctk.CTkLabel(
                 stats_frame,
                 text=text,
-                font=ctk.CTkFont(size=14)
+                font=get_font(14)
             )
             label.pack(side="left", padx=15)
             self.stats_labels[key] = label
@@ -217,10 +232,6 @@ class SessionMonitor(ctk.CTkFrame):
 
     def refresh(self, *args):
         """Refresh the session list."""
-        # Clear current items
-        for item in self.session_tree.get_children():
-            self.session_tree.delete(item)
-
         # Get filter values
         status_filter = self.status_var.get()
         exp_filter = self.experiment_var.get()
@@ -241,9 +252,8 @@ class SessionMonitor(ctk.CTkFrame):
         # Update statistics
         self.update_statistics(sessions)
 
-        # Add sessions to tree
-        for session in sessions:
-            self.add_session_to_tree(session)
+        # Update the tree in place
+        self.sync_session_rows(sessions)
 
         # Apply styling
         self.session_tree.tag_configure("overdue", foreground="red")
@@ -362,8 +372,34 @@ class SessionMonitor(ctk.CTkFrame):
 
         return recent_sessions
 
-    def add_session_to_tree(self, session):
-        """Add a session to the tree view."""
+    def sync_session_rows(self, sessions):
+        """Update the session tree in place, touching only rows that changed."""
+        rows = {}
+        for session in sessions:
+            rows[str(session['id'])] = self.build_session_row(session)
+
+        # Drop rows that are no longer in the list
+        stale = [iid for iid in self._session_row_values if iid not in rows]
+        if stale:
+            self.session_tree.delete(*stale)
+            for iid in stale:
+                del self._session_row_values[iid]
+
+        for iid, (values, tags) in rows.items():
+            if iid not in self._session_row_values:
+                self.session_tree.insert("", "end", iid=iid, values=values, tags=tags)
+            elif self._session_row_values[iid] != (values, tags):
+                self.session_tree.item(iid, values=values, tags=tags)
+            self._session_row_values[iid] = (values, tags)
+
+        # Restore query order only if it no longer matches the tree
+        order = tuple(rows)
+        if self.session_tree.get_children() != order:
+            for index, iid in enumerate(order):
+                self.session_tree.move(iid, "", index)
+
+    def build_session_row(self, session):
+        """Build the tree values and tags for a session."""
         session_date = datetime.fromisoformat(session['session_date'])
 
         # Calculate duration
@@ -390,7 +426,7 @@ class SessionMonitor(ctk.CTkFrame):
         progress_parts = []
         for task in session['tasks_assigned']:
             count = task_progress.get(task, 0)
-            task_display = TaskType.get_display_name(TaskType(task))[:10]  # Abbreviated
+            task_display = _TASK_SHORT_NAMES[task]
             progress_parts.append(f"{task_display}: {count}/30")
 
         progress = " | ".join(progress_parts)
@@ -411,21 +447,16 @@ class SessionMonitor(ctk.CTkFrame):
         # Get experiment info
         exp_code = session.get('experiment_code', 'N/A')
 
-        # Insert into tree
-        self.session_tree.insert(
-            "",
-            "end",
-            values=(
-                session['participant_code'],
-                exp_code,
-                f"S{session['session_number']}",
-                session_date.strftime("%m/%d %H:%M"),
-                duration,
-                progress,
-                status
-            ),
-            tags=(session['id'], tag)
+        values = (
+            session['participant_code'],
+            exp_code,
+            f"S{session['session_number']}",
+            session_date.strftime("%m/%d %H:%M"),
+            duration,
+            progress,
+            status
         )
+        return values, (session['id'], tag)
 
     def update_statistics(self, sessions):
         """Update the statistics labels."""
@@ -482,13 +513,6 @@ class SessionMonitor(ctk.CTkFrame):
         if not self.current_session_id:
             return
 
-        # Create details window
-        details_window = ctk.CTkToplevel(self)
-        details_window.title("Session Details")
-        details_window.geometry("600x500")
-        details_window.transient(self)
-        details_window.grab_set()
-
         # Get session data
         session = None
         all_sessions = self.get_all_recent_sessions()
@@ -499,16 +523,11 @@ class SessionMonitor(ctk.CTkFrame):
 
         if not session:
             messagebox.showerror("Error", "Session not found")
-            details_window.destroy()
             return
 
         # Get trials
         trials = self.db_manager.get_session_trials(session['id'])
 
-        # Display details
-        info_text = ctk.CTkTextbox(details_window, height=400)
-        info_text.pack(fill="both", expand=True, padx=20, pady=20)
-
         # Build details text
         details = []
         details.append(f"PARTICIPANT: {session['participant_code']}")
@@ -522,7 +541,7 @@ class SessionMonitor(ctk.CTkFrame):
 
         details.append(f"\nTASKS ASSIGNED:")
         for task in session['tasks_assigned']:
-            details.append(f"  - {TaskType.get_display_name(TaskType(task))}")
+            details.append(f"  - {TaskType.display_name_of(task)}")
 
         details.append(f"\nTRIAL SUMMARY:")
 
@@ -534,7 +553,7 @@ class SessionMonitor(ctk.CTkFrame):
             task_trials[trial['task_name']].append(trial)
 
         for task, task_trial_list in task_trials.items():
-            details.append(f"\n{TaskType.get_display_name(TaskType(task))}:")
+            details.append(f"\n{TaskType.display_name_of(task)}:")
             details.append(f"  Trials: {len(task_trial_list)}/30")
 
             if task_trial_list:
@@ -546,17 +565,51 @@ class SessionMonitor(ctk.CTkFrame):
                 details.append(f"  Total Points: {total_points}")
                 details.append(f"  Success Rate: {success_rate:.1%}")
 
-        info_text.insert("1.0", "\n".join(details))
-        info_text.configure(state="disabled")
+        # Show the details, reusing the window from the previous view
+        if self._details_window is None:
+            self.create_details_window()
+
+        details_text = "\n".join(details)
+        if details_text != self._details_shown:
+            info_text = self._details_text
+            info_text.configure(state="normal")
+            info_text.delete("1.0", "end")
+            info_text.insert("1.0", details_text)
+            info_text.configure(state="disabled")
+            self._details_shown = details_text
+
+        self._details_window.deiconify()
+        self._details_window.lift()
+        self._details_window.grab_set()
+
+    def create_details_window(self):
+        """Create the session details window (initially withdrawn)."""
+        details_window = ctk.CTkToplevel(self)
+        details_window.withdraw()
+        details_window.title("Session Details")
+        details_window.geometry("600x500")
+        details_window.transient(self)
+        details_window.protocol("WM_DELETE_WINDOW", self.hide_details_window)
+
+        info_text = ctk.CTkTextbox(details_window, height=400)
+        info_text.pack(fill="both", expand=True, padx=20, pady=20)
 
         # Close button
         close_btn = ctk.CTkButton(
             details_window,
             text="Close",
-            command=details_window.destroy
+            command=self.hide_details_window
         )
         close_btn.pack(pady=10)
 
+        self._details_window = details_window
+        self._details_text = info_text
+
+    def hide_details_window(self):
+        """Close the details window, keeping it for the next session viewed."""
+        self._details_window.grab_release()
+        self._details_window.withdraw()
+
     def export_session(self):
         """Export selected session data."""
         if not self.current_session_id:
@@ -675,8 +728,9 @@ class SessionMonitor(ctk.CTkFrame):
             self.schedule_refresh()
         else:
             # Cancel any pending refresh
-            if hasattr(self, 'refresh_job'):
+            if self.refresh_job is not None:
                 self.after_cancel(self.refresh_job)
+                self.refresh_job = None
 
     def schedule_refresh(self):
         """Schedule next automatic refresh."""
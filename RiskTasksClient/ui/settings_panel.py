@@ -7,10 +7,119 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import customtkinter as ctk
 import json
+import os
+import subprocess
+import sys
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, Callable
 
-from database.models import TaskType
+from database.models import TaskType, TASK_SCRIPTS
+from utils.fonts import get_font
+
+
+# Every setting shown in the panel: (config section path, key, variable
+# attribute(s), default). Ranges map onto a (min, max) pair of variables.
+_SETTINGS_FIELDS = (
+    (("experiment",), "total_trials_per_task", "trials_var", 30),
+    (("experiment",), "session_gap_days", "gap_var", 14),
+    (("experiment",), "max_session_duration", "duration_var", 60),
+    (("display",), "fullscreen", "fullscreen_var", True),
+    (("display",), "resolution", "resolution_var", "1920x1080"),
+    (("data",), "auto_backup", "backup_var", True),
+    (("data",), "backup_interval_hours", "interval_var", 24),
+    (("tasks", "bart"), "max_pumps", "bart_max_pumps_var", 48),
+    (("tasks", "bart"), "points_per_pump", "bart_points_var", 5),
+    (("tasks", "bart"), "explosion_range", ("bart_min_var", "bart_max_var"), [8, 48]),
+    (("tasks", "bart"), "keyboard_input_mode", "bart_keyboard_mode_var", False),
+    (("tasks", "bart"), "balloon_color", "bart_balloon_color_var", "Red"),
+    (("tasks", "bart"), "random_colors", "bart_random_colors_var", False),
+    (("tasks", "ice_fishing"), "max_fish", "ice_max_fish_var", 64),
+    (("tasks", "ice_fishing"), "points_per_fish", "ice_points_var", 5),
+    (("tasks", "mountain_mining"), "max_ore", "mining_max_ore_var", 64),
+    (("tasks", "mountain_mining"), "points_per_ore", "mining_points_var", 5),
+    (("tasks", "spinning_bottle"), "segments", "stb_segments_var", 16),
+    (("tasks", "spinning_bottle"), "points_per_add", "stb_points_var", 5),
+    (("tasks", "spinning_bottle"), "spin_speed_range", ("stb_min_speed_var", "stb_max_speed_var"), [12.0, 18.0]),
+    (("tasks", "spinning_bottle"), "win_color", "stb_win_color_var", "Green"),
+    (("tasks", "spinning_bottle"), "loss_color", "stb_loss_color_var", "Red"),
+)
+
+
+# Rows of each task's settings section, in display order:
+#   ("switch", label, variable, switch text, command method or None, hint or None)
+#   ("menu", label, variable, values, width, attribute the menu is stored under)
+#   ("entry", label, variable)
+#   ("range", label, (min variable, max variable))
+#   ("info", text)
+_TASK_SETTING_ROWS = {
+    "bart": (
+        ("switch", "Input mode:", "bart_keyboard_mode_var",
+         "Keyboard input mode (type number of pumps)", None,
+         "(Off = Click to pump, On = Type number of pumps)"),
+        ("menu", "Balloon color:", "bart_balloon_color_var",
+         ("Red", "Blue", "Green", "Yellow", "Orange", "Purple", "Pink"), 150, "bart_color_menu"),
+        ("switch", "Random colors:", "bart_random_colors_var",
+         "Use random color for each balloon", "on_bart_random_toggle", None),
+        ("entry", "Maximum pumps:", "bart_max_pumps_var"),
+        ("entry", "Points per pump:", "bart_points_var"),
+        ("range", "Explosion range (min-max):", ("bart_min_var", "bart_max_var")),
+    ),
+    "ice_fishing": (
+        ("entry", "Maximum fish:", "ice_max_fish_var"),
+        ("entry", "Points per fish:", "ice_points_var"),
+        ("info", "ℹ️ Uses selection without replacement for break points"),
+    ),
+    "mountain_mining": (
+        ("entry", "Maximum ore:", "mining_max_ore_var"),
+        ("entry", "Points per ore:", "mining_points_var"),
+        ("info", "ℹ️ Uses selection without replacement for snap points"),
+    ),
+    "spinning_bottle": (
+        ("menu", "Number of segments:", "stb_segments_var", ("8", "16", "32"), 100, "stb_segments_menu"),
+        ("menu", "Win segment color:", "stb_win_color_var",
+         ("Green", "Blue", "Yellow", "Orange", "Purple"), 150, "stb_win_color_menu"),
+        ("menu", "Loss segment color:", "stb_loss_color_var",
+         ("Red", "Blue", "Yellow", "Orange", "Purple"), 150, "stb_loss_color_menu"),
+        ("entry", "Points per add:", "stb_points_var"),
+        ("range", "Spin speed range:", ("stb_min_speed_var", "stb_max_speed_var")),
+    ),
+}
+
+
+@lru_cache(maxsize=1)
+def _default_config() -> Dict:
+    """Nested default configuration built from _SETTINGS_FIELDS.
+
+    Cached, so callers must copy it before handing it out for editing.
+    """
+    config = {}
+    for path, key, _, default in _SETTINGS_FIELDS:
+        section = config
+        for name in path:
+            section = section.setdefault(name, {})
+        section[key] = default
+    return config
+
+
+def _copy_config(value):
+    """Copy a JSON-style config; dicts and lists are copied, scalars shared."""
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    return value
+
+
+def _set_if_changed(var: tk.Variable, value):
+    """Set a Tk variable only if it differs, sparing its traces and redraws."""
+    try:
+        if var.get() == value:
+            return
+    except tk.TclError:
+        # Current contents don't parse (e.g. text typed into an IntVar entry)
+        pass
+    var.set(value)
 
 
 class SettingsPanel(ctk.CTkFrame):
@@ -23,7 +132,7 @@ class SettingsPanel(ctk.CTkFrame):
         self.task_config_frames = {}
 
         # Create a copy of config for editing
-        self.working_config = json.loads(json.dumps(config))
+        self.working_config = _copy_config(config)
 
         # Initialize all variables with defaults
         self.initialize_variables()
@@ -80,7 +189,7 @@ class SettingsPanel(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(24, "bold")
         )
         title_label.pack(pady=20)
 
@@ -138,7 +247,7 @@ class SettingsPanel(ctk.CTkFrame):
         label = ctk.CTkLabel(
             header_frame,
             text=text,
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         label.pack(side="left", padx=10)
 
@@ -153,83 +262,35 @@ class SettingsPanel(ctk.CTkFrame):
         exp_frame = ctk.CTkFrame(self.scroll_frame)
         exp_frame.pack(fill="x", padx=20, pady=10)
 
-        # Trials per task
-        trials_frame = ctk.CTkFrame(exp_frame, fg_color="transparent")
-        trials_frame.pack(fill="x", pady=5)
-
-        trials_label = ctk.CTkLabel(
-            trials_frame,
-            text="Trials per task:",
-            width=200,
-            anchor="w"
-        )
-        trials_label.pack(side="left", padx=10)
-
-        trials_spinbox = ctk.CTkEntry(
-            trials_frame,
-            textvariable=self.trials_var,
-            width=100
-        )
-        trials_spinbox.pack(side="left", padx=10)
-
-        trials_info = ctk.CTkLabel(
-            trials_frame,
-            text="(Number of trials for each task)",
-            text_color="gray"
-        )
-        trials_info.pack(side="left", padx=10)
-
-        # Session gap
-        gap_frame = ctk.CTkFrame(exp_frame, fg_color="transparent")
-        gap_frame.pack(fill="x", pady=5)
-
-        gap_label = ctk.CTkLabel(
-            gap_frame,
-            text="Session gap (days):",
-            width=200,
-            anchor="w"
-        )
-        gap_label.pack(side="left", padx=10)
-
-        gap_spinbox = ctk.CTkEntry(
-            gap_frame,
-            textvariable=self.gap_var,
-            width=100
-        )
-        gap_spinbox.pack(side="left", padx=10)
-
-        gap_info = ctk.CTkLabel(
-            gap_frame,
-            text="(Days between sessions)",
-            text_color="gray"
-        )
-        gap_info.pack(side="left", padx=10)
-
-        # Max session duration
-        duration_frame = ctk.CTkFrame(exp_frame, fg_color="transparent")
-        duration_frame.pack(fill="x", pady=5)
+        # One grid for all rows: label, entry, hint
+        rows = [
+            ("Trials per task:", self.trials_var, "(Number of trials for each task)"),
+            ("Session gap (days):", self.gap_var, "(Days between sessions)"),
+            ("Max session duration (min):", self.duration_var, "(Maximum time per session)"),
+        ]
 
-        duration_label = ctk.CTkLabel(
-            duration_frame,
-            text="Max session duration (min):",
-            width=200,
-            anchor="w"
-        )
-        duration_label.pack(side="left", padx=10)
+        for row, (label_text, var, info_text) in enumerate(rows):
+            label = ctk.CTkLabel(
+                exp_frame,
+                text=label_text,
+                width=200,
+                anchor="w"
+            )
+            label.grid(row=row, column=0, sticky="w", padx=10, pady=5)
 
-        duration_spinbox = ctk.CTkEntry(
-            duration_frame,
-            textvariable=self.duration_var,
-            width=100
-        )
-        duration_spinbox.pack(side="left", padx=10)
+            entry = ctk.CTkEntry(
+                exp_frame,
+                textvariable=var,
+                width=100
+            )
+            entry.grid(row=row, column=1, sticky="w", padx=10, pady=5)
 
-        duration_info = ctk.CTkLabel(
-            duration_frame,
-            text="(Maximum time per session)",
-            text_color="gray"
-        )
-        duration_info.pack(side="left", padx=10)
+            info = ctk.CTkLabel(
+                exp_frame,
+                text=info_text,
+                text_color="gray"
+            )
+            info.grid(row=row, column=2, sticky="w", padx=10, pady=5)
 
     def create_display_settings(self):
         """Create display configuration section."""
@@ -239,43 +300,37 @@ class SettingsPanel(ctk.CTkFrame):
         display_frame.pack(fill="x", padx=20, pady=10)
 
         # Fullscreen toggle
-        fullscreen_frame = ctk.CTkFrame(display_frame, fg_color="transparent")
-        fullscreen_frame.pack(fill="x", pady=5)
-
         fullscreen_label = ctk.CTkLabel(
-            fullscreen_frame,
+            display_frame,
             text="Fullscreen mode:",
             width=200,
             anchor="w"
         )
-        fullscreen_label.pack(side="left", padx=10)
+        fullscreen_label.grid(row=0, column=0, sticky="w", padx=10, pady=5)
 
         fullscreen_switch = ctk.CTkSwitch(
-            fullscreen_frame,
+            display_frame,
             text="Enable fullscreen for tasks",
             variable=self.fullscreen_var
         )
-        fullscreen_switch.pack(side="left", padx=10)
+        fullscreen_switch.grid(row=0, column=1, sticky="w", padx=10, pady=5)
 
         # Resolution
-        resolution_frame = ctk.CTkFrame(display_frame, fg_color="transparent")
-        resolution_frame.pack(fill="x", pady=5)
-
         resolution_label = ctk.CTkLabel(
-            resolution_frame,
+            display_frame,
             text="Resolution:",
             width=200,
             anchor="w"
         )
-        resolution_label.pack(side="left", padx=10)
+        resolution_label.grid(row=1, column=0, sticky="w", padx=10, pady=5)
 
         resolution_menu = ctk.CTkOptionMenu(
-            resolution_frame,
+            display_frame,
             variable=self.resolution_var,
             values=["1920x1080", "1600x900", "1366x768", "1280x720"],
             width=150
         )
-        resolution_menu.pack(side="left", padx=10)
+        resolution_menu.grid(row=1, column=1, sticky="w", padx=10, pady=5)
 
     def create_data_settings(self):
         """Create data management settings section."""
@@ -283,10 +338,11 @@ class SettingsPanel(ctk.CTkFrame):
 
         data_frame = ctk.CTkFrame(self.scroll_frame)
         data_frame.pack(fill="x", padx=20, pady=10)
+        data_frame.grid_columnconfigure(0, weight=1)
 
         # Auto backup
         backup_frame = ctk.CTkFrame(data_frame, fg_color="transparent")
-        backup_frame.pack(fill="x", pady=5)
+        backup_frame.grid(row=0, column=0, sticky="ew", pady=5)
 
         backup_label = ctk.CTkLabel(
             backup_frame,
@@ -304,9 +360,9 @@ class SettingsPanel(ctk.CTkFrame):
         )
         backup_switch.pack(side="left", padx=10)
 
-        # Backup interval
+        # Backup interval; gridded so grid_remove() can hide it in place
         self.interval_frame = ctk.CTkFrame(data_frame, fg_color="transparent")
-        self.interval_frame.pack(fill="x", pady=5)
+        self.interval_frame.grid(row=1, column=0, sticky="ew", pady=5)
 
         interval_label = ctk.CTkLabel(
             self.interval_frame,
@@ -326,13 +382,13 @@ class SettingsPanel(ctk.CTkFrame):
     def create_task_settings(self):
         """Create task-specific settings sections."""
         tasks = [
-            ("BART", "bart", self.create_bart_settings),
-            ("Ice Fishing", "ice_fishing", self.create_ice_fishing_settings),
-            ("Mountain Mining", "mountain_mining", self.create_mining_settings),
-            ("Spinning Bottle", "spinning_bottle", self.create_stb_settings)
+            ("BART", "bart"),
+            ("Ice Fishing", "ice_fishing"),
+            ("Mountain Mining", "mountain_mining"),
+            ("Spinning Bottle", "spinning_bottle")
         ]
 
-        for display_name, task_key, create_func in tasks:
+        for display_name, task_key in tasks:
             # Create header with test button
             self.create_task_section_header(self.scroll_frame, display_name, task_key)
 
@@ -340,7 +396,7 @@ class SettingsPanel(ctk.CTkFrame):
             task_frame.pack(fill="x", padx=20, pady=10)
 
             self.task_config_frames[task_key] = task_frame
-            create_func(task_frame, task_key)
+            self.build_setting_rows(task_frame, _TASK_SETTING_ROWS[task_key])
 
     def create_task_section_header(self, parent, display_name: str, task_key: str):
         """Create a task section header with test button."""
@@ -351,7 +407,7 @@ class SettingsPanel(ctk.CTkFrame):
         label = ctk.CTkLabel(
             header_frame,
             text=f"{display_name} Settings",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         label.pack(side="left", padx=10)
 
@@ -363,371 +419,108 @@ class SettingsPanel(ctk.CTkFrame):
         test_button = ctk.CTkButton(
             header_frame,
             text=f"🧪 Test {display_name}",
-            command=lambda: self.run_test_task(task_key, display_name),
+            command=partial(self.run_test_task, task_key, display_name),
             width=150,
             height=35,
             fg_color="#FF6B35",  # Orange color for test buttons
             hover_color="#FF8C69",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
         test_button.pack(side="right", padx=10)
 
-    def create_bart_settings(self, parent, task_key):
-        """Create BART-specific settings."""
-        # Input mode selection
-        mode_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        mode_frame.pack(fill="x", pady=5)
-
-        mode_label = ctk.CTkLabel(
-            mode_frame,
-            text="Input mode:",
-            width=200,
-            anchor="w"
-        )
-        mode_label.pack(side="left", padx=10)
-
-        mode_switch = ctk.CTkSwitch(
-            mode_frame,
-            text="Keyboard input mode (type number of pumps)",
-            variable=self.bart_keyboard_mode_var
-        )
-        mode_switch.pack(side="left", padx=10)
-
-        mode_info = ctk.CTkLabel(
-            mode_frame,
-            text="(Off = Click to pump, On = Type number of pumps)",
-            text_color="gray",
-            font=ctk.CTkFont(size=12)
-        )
-        mode_info.pack(side="left", padx=10)
-
-        # Balloon color selection
-        color_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        color_frame.pack(fill="x", pady=5)
-
-        color_label = ctk.CTkLabel(
-            color_frame,
-            text="Balloon color:",
-            width=200,
-            anchor="w"
-        )
-        color_label.pack(side="left", padx=10)
-
-        self.bart_color_menu = ctk.CTkOptionMenu(
-            color_frame,
-            variable=self.bart_balloon_color_var,
-            values=["Red", "Blue", "Green", "Yellow", "Orange", "Purple", "Pink"],
-            width=150
-        )
-        self.bart_color_menu.pack(side="left", padx=10)
-
-        # Random colors option
-        random_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        random_frame.pack(fill="x", pady=5)
-
-        random_label = ctk.CTkLabel(
-            random_frame,
-            text="Random colors:",
-            width=200,
-            anchor="w"
-        )
-        random_label.pack(side="left", padx=10)
-
-        random_switch = ctk.CTkSwitch(
-            random_frame,
-            text="Use random color for each balloon",
-            variable=self.bart_random_colors_var,
-            command=self.on_bart_random_toggle
-        )
-        random_switch.pack(side="left", padx=10)
-
-        # Max pumps
-        max_pumps_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        max_pumps_frame.pack(fill="x", pady=5)
-
-        max_pumps_label = ctk.CTkLabel(
-            max_pumps_frame,
-            text="Maximum pumps:",
-            width=200,
-            anchor="w"
-        )
-        max_pumps_label.pack(side="left", padx=10)
-
-        max_pumps_entry = ctk.CTkEntry(
-            max_pumps_frame,
-            textvariable=self.bart_max_pumps_var,
-            width=100
-        )
-        max_pumps_entry.pack(side="left", padx=10)
-
-        # Points per pump
-        points_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        points_frame.pack(fill="x", pady=5)
-
-        points_label = ctk.CTkLabel(
-            points_frame,
-            text="Points per pump:",
-            width=200,
-            anchor="w"
-        )
-        points_label.pack(side="left", padx=10)
-
-        points_entry = ctk.CTkEntry(
-            points_frame,
-            textvariable=self.bart_points_var,
-            width=100
-        )
-        points_entry.pack(side="left", padx=10)
-
-        # Explosion range
-        range_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        range_frame.pack(fill="x", pady=5)
-
-        range_label = ctk.CTkLabel(
-            range_frame,
-            text="Explosion range (min-max):",
-            width=200,
-            anchor="w"
-        )
-        range_label.pack(side="left", padx=10)
-
-        min_entry = ctk.CTkEntry(
-            range_frame,
-            textvariable=self.bart_min_var,
-            width=60
-        )
-        min_entry.pack(side="left", padx=5)
-
-        dash_label = ctk.CTkLabel(range_frame, text="-")
-        dash_label.pack(side="left")
-
-        max_entry = ctk.CTkEntry(
-            range_frame,
-            textvariable=self.bart_max_var,
-            width=60
-        )
-        max_entry.pack(side="left", padx=5)
-
-    def create_ice_fishing_settings(self, parent, task_key):
-        """Create Ice Fishing settings."""
-        # Max fish
-        max_fish_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        max_fish_frame.pack(fill="x", pady=5)
-
-        max_fish_label = ctk.CTkLabel(
-            max_fish_frame,
-            text="Maximum fish:",
-            width=200,
-            anchor="w"
-        )
-        max_fish_label.pack(side="left", padx=10)
-
-        max_fish_entry = ctk.CTkEntry(
-            max_fish_frame,
-            textvariable=self.ice_max_fish_var,
-            width=100
-        )
-        max_fish_entry.pack(side="left", padx=10)
-
-        # Points per fish
-        points_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        points_frame.pack(fill="x", pady=5)
-
-        points_label = ctk.CTkLabel(
-            points_frame,
-            text="Points per fish:",
-            width=200,
-            anchor="w"
-        )
-        points_label.pack(side="left", padx=10)
-
-        points_entry = ctk.CTkEntry(
-            points_frame,
-            textvariable=self.ice_points_var,
-            width=100
-        )
-        points_entry.pack(side="left", padx=10)
-
-        # Info about selection without replacement
-        info_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        info_frame.pack(fill="x", pady=5)
-
-        info_label = ctk.CTkLabel(
-            info_frame,
-            text="ℹ️ Uses selection without replacement for break points",
-            text_color="gray",
-            font=ctk.CTkFont(size=12)
-        )
-        info_label.pack(side="left", padx=10)
-
-    def create_mining_settings(self, parent, task_key):
-        """Create Mountain Mining settings."""
-        # Max ore
-        max_ore_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        max_ore_frame.pack(fill="x", pady=5)
-
-        max_ore_label = ctk.CTkLabel(
-            max_ore_frame,
-            text="Maximum ore:",
-            width=200,
-            anchor="w"
-        )
-        max_ore_label.pack(side="left", padx=10)
-
-        max_ore_entry = ctk.CTkEntry(
-            max_ore_frame,
-            textvariable=self.mining_max_ore_var,
-            width=100
-        )
-        max_ore_entry.pack(side="left", padx=10)
-
-        # Points per ore
-        points_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        points_frame.pack(fill="x", pady=5)
-
-        points_label = ctk.CTkLabel(
-            points_frame,
-            text="Points per ore:",
-            width=200,
-            anchor="w"
-        )
-        points_label.pack(side="left", padx=10)
-
-        points_entry = ctk.CTkEntry(
-            points_frame,
-            textvariable=self.mining_points_var,
-            width=100
-        )
-        points_entry.pack(side="left", padx=10)
-
-        # Info about selection without replacement
-        info_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        info_frame.pack(fill="x", pady=5)
-
-        info_label = ctk.CTkLabel(
-            info_frame,
-            text="ℹ️ Uses selection without replacement for snap points",
-            text_color="gray",
-            font=ctk.CTkFont(size=12)
-        )
-        info_label.pack(side="left", padx=10)
-
-    def create_stb_settings(self, parent, task_key):
-        """Create Spinning Bottle settings."""
-        # Segments dropdown
-        segments_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        segments_frame.pack(fill="x", pady=5)
-
-        segments_label = ctk.CTkLabel(
-            segments_frame,
-            text="Number of segments:",
-            width=200,
-            anchor="w"
-        )
-        segments_label.pack(side="left", padx=10)
-
-        self.stb_segments_menu = ctk.CTkOptionMenu(
-            segments_frame,
-            variable=self.stb_segments_var,
-            values=["8", "16", "32"],
-            width=100
-        )
-        self.stb_segments_menu.pack(side="left", padx=10)
-
-        # Win color dropdown
-        win_color_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        win_color_frame.pack(fill="x", pady=5)
-
-        win_color_label = ctk.CTkLabel(
-            win_color_frame,
-            text="Win segment color:",
-            width=200,
-            anchor="w"
-        )
-        win_color_label.pack(side="left", padx=10)
-
-        self.stb_win_color_menu = ctk.CTkOptionMenu(
-            win_color_frame,
-            variable=self.stb_win_color_var,
-            values=["Green", "Blue", "Yellow", "Orange", "Purple"],
-            width=150
-        )
-        self.stb_win_color_menu.pack(side="left", padx=10)
-
-        # Loss color dropdown
-        loss_color_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        loss_color_frame.pack(fill="x", pady=5)
-
-        loss_color_label = ctk.CTkLabel(
-            loss_color_frame,
-            text="Loss segment color:",
-            width=200,
-            anchor="w"
-        )
-        loss_color_label.pack(side="left", padx=10)
-
-        self.stb_loss_color_menu = ctk.CTkOptionMenu(
-            loss_color_frame,
-            variable=self.stb_loss_color_var,
-            values=["Red", "Blue", "Yellow", "Orange", "Purple"],
-            width=150
-        )
-        self.stb_loss_color_menu.pack(side="left", padx=10)
-
-        # Points per add
-        points_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        points_frame.pack(fill="x", pady=5)
-
-        points_label = ctk.CTkLabel(
-            points_frame,
-            text="Points per add:",
-            width=200,
-            anchor="w"
-        )
-        points_label.pack(side="left", padx=10)
-
-        points_entry = ctk.CTkEntry(
-            points_frame,
-            textvariable=self.stb_points_var,
-            width=100
-        )
-        points_entry.pack(side="left", padx=10)
-
-        # Spin speed range
-        speed_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        speed_frame.pack(fill="x", pady=5)
+    def build_setting_rows(self, parent, rows):
+        """Build a task's settings rows from its _TASK_SETTING_ROWS spec.
+
+        All rows share one grid on parent: label, control, hint.
+        """
+        for row, (kind, *spec) in enumerate(rows):
+            if kind == "info":
+                info_label = ctk.CTkLabel(
+                    parent,
+                    text=spec[0],
+                    text_color="gray",
+                    font=get_font(12)
+                )
+                info_label.grid(row=row, column=0, columnspan=3, sticky="w", padx=10, pady=5)
+                continue
+
+            label_text, var_attr = spec[0], spec[1]
+            label = ctk.CTkLabel(
+                parent,
+                text=label_text,
+                width=200,
+                anchor="w"
+            )
+            label.grid(row=row, column=0, sticky="w", padx=10, pady=5)
 
-        speed_label = ctk.CTkLabel(
-            speed_frame,
-            text="Spin speed range:",
-            width=200,
-            anchor="w"
-        )
-        speed_label.pack(side="left", padx=10)
+            if kind == "entry":
+                entry = ctk.CTkEntry(
+                    parent,
+                    textvariable=getattr(self, var_attr),
+                    width=100
+                )
+                entry.grid(row=row, column=1, sticky="w", padx=10, pady=5)
+
+            elif kind == "range":
+                # The min/max pair needs its own container to sit in one cell
+                min_attr, max_attr = var_attr
+                range_frame = ctk.CTkFrame(parent, fg_color="transparent")
+                range_frame.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+
+                min_entry = ctk.CTkEntry(
+                    range_frame,
+                    textvariable=getattr(self, min_attr),
+                    width=60
+                )
+                min_entry.pack(side="left", padx=5)
 
-        min_speed_entry = ctk.CTkEntry(
-            speed_frame,
-            textvariable=self.stb_min_speed_var,
-            width=60
-        )
-        min_speed_entry.pack(side="left", padx=5)
+                dash_label = ctk.CTkLabel(range_frame, text="-")
+                dash_label.pack(side="left")
 
-        dash_label = ctk.CTkLabel(speed_frame, text="-")
-        dash_label.pack(side="left")
+                max_entry = ctk.CTkEntry(
+                    range_frame,
+                    textvariable=getattr(self, max_attr),
+                    width=60
+                )
+                max_entry.pack(side="left", padx=5)
+
+            elif kind == "menu":
+                values, width, widget_attr = spec[2:]
+                menu = ctk.CTkOptionMenu(
+                    parent,
+                    variable=getattr(self, var_attr),
+                    values=list(values),
+                    width=width
+                )
+                menu.grid(row=row, column=1, sticky="w", padx=10, pady=5)
+                setattr(self, widget_attr, menu)
+
+            elif kind == "switch":
+                switch_text, command_name, hint = spec[2:]
+                switch = ctk.CTkSwitch(
+                    parent,
+                    text=switch_text,
+                    variable=getattr(self, var_attr),
+                    command=getattr(self, command_name) if command_name else None
+                )
+                switch.grid(row=row, column=1, sticky="w", padx=10, pady=5)
 
-        max_speed_entry = ctk.CTkEntry(
-            speed_frame,
-            textvariable=self.stb_max_speed_var,
-            width=60
-        )
-        max_speed_entry.pack(side="left", padx=5)
+                if hint:
+                    hint_label = ctk.CTkLabel(
+                        parent,
+                        text=hint,
+                        text_color="gray",
+                        font=get_font(12)
+                    )
+                    hint_label.grid(row=row, column=2, sticky="w", padx=10, pady=5)
 
     def on_backup_toggle(self):
         """Handle backup toggle switch."""
+        # grid() restores the row's remembered position and options
         if self.backup_var.get():
-            self.interval_frame.pack(fill="x", pady=5)
+            self.interval_frame.grid()
         else:
-            self.interval_frame.pack_forget()
+            self.interval_frame.grid_remove()
 
     def on_bart_random_toggle(self):
         """Handle BART random colors toggle."""
@@ -740,57 +533,22 @@ class SettingsPanel(ctk.CTkFrame):
 
     def load_config_values(self):
         """Load current configuration values into UI."""
-        # Experiment settings
-        self.trials_var.set(self.config.get("experiment", {}).get("total_trials_per_task", 30))
-        self.gap_var.set(self.config.get("experiment", {}).get("session_gap_days", 14))
-        self.duration_var.set(self.config.get("experiment", {}).get("max_session_duration", 60))
-
-        # Display settings
-        self.fullscreen_var.set(self.config.get("display", {}).get("fullscreen", True))
-        self.resolution_var.set(self.config.get("display", {}).get("resolution", "1920x1080"))
-
-        # Data settings
-        self.backup_var.set(self.config.get("data", {}).get("auto_backup", True))
-        self.interval_var.set(self.config.get("data", {}).get("backup_interval_hours", 24))
-        self.on_backup_toggle()
+        for path, key, attrs, default in _SETTINGS_FIELDS:
+            section = self.config
+            for part in path:
+                section = section.get(part, {})
+            value = section.get(key, default)
+
+            if isinstance(attrs, tuple):
+                for attr, item in zip(attrs, value):
+                    _set_if_changed(getattr(self, attr), item)
+            else:
+                _set_if_changed(getattr(self, attrs), value)
 
-        # Task-specific settings
-        tasks_config = self.config.get("tasks", {})
-
-        # BART
-        bart_config = tasks_config.get("bart", {})
-        self.bart_max_pumps_var.set(bart_config.get("max_pumps", 48))
-        self.bart_points_var.set(bart_config.get("points_per_pump", 5))
-        self.bart_keyboard_mode_var.set(bart_config.get("keyboard_input_mode", False))
-        self.bart_balloon_color_var.set(bart_config.get("balloon_color", "Red"))
-        self.bart_random_colors_var.set(bart_config.get("random_colors", False))
-        explosion_range = bart_config.get("explosion_range", [8, 48])
-        self.bart_min_var.set(explosion_range[0])
-        self.bart_max_var.set(explosion_range[1])
-
-        # Update color menu state based on random setting
+        # Update dependent widget states
+        self.on_backup_toggle()
         self.on_bart_random_toggle()
 
-        # Ice Fishing
-        ice_config = tasks_config.get("ice_fishing", {})
-        self.ice_max_fish_var.set(ice_config.get("max_fish", 64))
-        self.ice_points_var.set(ice_config.get("points_per_fish", 5))
-
-        # Mountain Mining
-        mining_config = tasks_config.get("mountain_mining", {})
-        self.mining_max_ore_var.set(mining_config.get("max_ore", 64))
-        self.mining_points_var.set(mining_config.get("points_per_ore", 5))
-
-        # Spinning Bottle
-        stb_config = tasks_config.get("spinning_bottle", {})
-        self.stb_segments_var.set(stb_config.get("segments", 16))
-        self.stb_points_var.set(stb_config.get("points_per_add", 5))
-        speed_range = stb_config.get("spin_speed_range", [12.0, 18.0])
-        self.stb_min_speed_var.set(speed_range[0])
-        self.stb_max_speed_var.set(speed_range[1])
-        self.stb_win_color_var.set(stb_config.get("win_color", "Green"))
-        self.stb_loss_color_var.set(stb_config.get("loss_color", "Red"))
-
     def validate_settings(self):
         """Validate all settings before saving."""
         errors = []
@@ -830,48 +588,10 @@ class SettingsPanel(ctk.CTkFrame):
             )
             return
 
-        # Update working config
-        self.working_config["experiment"]["total_trials_per_task"] = self.trials_var.get()
-        self.working_config["experiment"]["session_gap_days"] = self.gap_var.get()
-        self.working_config["experiment"]["max_session_duration"] = self.duration_var.get()
-
-        self.working_config["display"]["fullscreen"] = self.fullscreen_var.get()
-        self.working_config["display"]["resolution"] = self.resolution_var.get()
-
-        self.working_config["data"]["auto_backup"] = self.backup_var.get()
-        self.working_config["data"]["backup_interval_hours"] = self.interval_var.get()
-
-        # Ensure tasks section exists
-        if "tasks" not in self.working_config:
-            self.working_config["tasks"] = {}
-
-        # Task configs
-        self.working_config["tasks"]["bart"] = {
-            "max_pumps": self.bart_max_pumps_var.get(),
-            "points_per_pump": self.bart_points_var.get(),
-            "explosion_range": [self.bart_min_var.get(), self.bart_max_var.get()],
-            "keyboard_input_mode": self.bart_keyboard_mode_var.get(),
-            "balloon_color": self.bart_balloon_color_var.get(),
-            "random_colors": self.bart_random_colors_var.get()
-        }
-
-        self.working_config["tasks"]["ice_fishing"] = {
-            "max_fish": self.ice_max_fish_var.get(),
-            "points_per_fish": self.ice_points_var.get()
-        }
-
-        self.working_config["tasks"]["mountain_mining"] = {
-            "max_ore": self.mining_max_ore_var.get(),
-            "points_per_ore": self.mining_points_var.get()
-        }
-
-        self.working_config["tasks"]["spinning_bottle"] = {
-            "segments": self.stb_segments_var.get(),
-            "points_per_add": self.stb_points_var.get(),
-            "spin_speed_range": [self.stb_min_speed_var.get(), self.stb_max_speed_var.get()],
-            "win_color": self.stb_win_color_var.get(),
-            "loss_color": self.stb_loss_color_var.get()
-        }
+        # Update working config; each task's settings are replaced as a whole
+        values = self.get_current_config_values()
+        for section, section_values in values.items():
+            self.working_config.setdefault(section, {}).update(section_values)
 
         # Update main config
         self.config.update(self.working_config)
@@ -889,50 +609,10 @@ class SettingsPanel(ctk.CTkFrame):
         )
 
         if result:
-            # Create default config
-            default_config = {
-                "experiment": {
-                    "total_trials_per_task": 30,
-                    "session_gap_days": 14,
-                    "max_session_duration": 60
-                },
-                "display": {
-                    "fullscreen": True,
-                    "resolution": "1920x1080"
-                },
-                "data": {
-                    "auto_backup": True,
-                    "backup_interval_hours": 24
-                },
-                "tasks": {
-                    "bart": {
-                        "max_pumps": 48,
-                        "points_per_pump": 5,
-                        "explosion_range": [8, 48],
-                        "keyboard_input_mode": False,
-                        "balloon_color": "Red",
-                        "random_colors": False
-                    },
-                    "ice_fishing": {
-                        "max_fish": 64,
-                        "points_per_fish": 5
-                    },
-                    "mountain_mining": {
-                        "max_ore": 64,
-                        "points_per_ore": 5
-                    },
-                    "spinning_bottle": {
-                        "segments": 16,
-                        "points_per_add": 5,
-                        "spin_speed_range": [12.0, 18.0],
-                        "win_color": "Green",
-                        "loss_color": "Red"
-                    }
-                }
-            }
-
-            self.config.update(default_config)
-            self.working_config = json.loads(json.dumps(default_config))
+            default_config = _default_config()
+
+            self.config.update(_copy_config(default_config))
+            self.working_config = _copy_config(default_config)
             self.load_config_values()
 
             messagebox.showinfo("Success", "Settings reset to defaults!")
@@ -963,25 +643,17 @@ class SettingsPanel(ctk.CTkFrame):
         temp_config_path = Path("config/temp_test_settings.json")
         try:
             with open(temp_config_path, 'w') as f:
-                json.dump(temp_config, f, indent=4)
+                json.dump(temp_config, f, separators=(',', ':'))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create temporary config: {e}")
             return
 
-        # Task file mapping
-        task_files = {
-            "bart": "bart_task.py",
-            "ice_fishing": "ice_task.py",
-            "mountain_mining": "mining_task.py",
-            "spinning_bottle": "stb_task.py"
-        }
-
-        if task_key not in task_files:
+        if task_key not in TASK_SCRIPTS:
             messagebox.showerror("Error", f"Unknown task: {task_key}")
             return
 
         # Get task file path
-        task_file = Path("tasks") / task_files[task_key]
+        task_file = Path("tasks") / TASK_SCRIPTS[task_key]
 
         if not task_file.exists():
             messagebox.showerror(
@@ -1006,10 +678,6 @@ class SettingsPanel(ctk.CTkFrame):
             return
 
         # Prepare environment variables for test mode
-        import os
-        import subprocess
-        import sys
-
         env = {
             **os.environ,
             "SESSION_ID": "999",  # Special test session ID
@@ -1032,7 +700,7 @@ class SettingsPanel(ctk.CTkFrame):
                      f"The task will open in a new window.\n"
                      f"Press ESC in the task to exit.\n\n"
                      f"This window will close automatically\nwhen the test ends.",
-                font=ctk.CTkFont(size=14),
+                font=get_font(14),
                 justify="center"
             )
             info_label.pack(expand=True)
@@ -1080,44 +748,15 @@ class SettingsPanel(ctk.CTkFrame):
 
     def get_current_config_values(self) -> dict:
         """Get current configuration values from the UI."""
-        temp_config = {
-            "experiment": {
-                "total_trials_per_task": self.trials_var.get(),
-                "session_gap_days": self.gap_var.get(),
-                "max_session_duration": self.duration_var.get()
-            },
-            "display": {
-                "fullscreen": self.fullscreen_var.get(),
-                "resolution": self.resolution_var.get()
-            },
-            "data": {
-                "auto_backup": self.backup_var.get(),
-                "backup_interval_hours": self.interval_var.get()
-            },
-            "tasks": {
-                "bart": {
-                    "max_pumps": self.bart_max_pumps_var.get(),
-                    "points_per_pump": self.bart_points_var.get(),
-                    "explosion_range": [self.bart_min_var.get(), self.bart_max_var.get()],
-                    "keyboard_input_mode": self.bart_keyboard_mode_var.get(),
-                    "balloon_color": self.bart_balloon_color_var.get(),
-                    "random_colors": self.bart_random_colors_var.get()
-                },
-                "ice_fishing": {
-                    "max_fish": self.ice_max_fish_var.get(),
-                    "points_per_fish": self.ice_points_var.get()
-                },
-                "mountain_mining": {
-                    "max_ore": self.mining_max_ore_var.get(),
-                    "points_per_ore": self.mining_points_var.get()
-                },
-                "spinning_bottle": {
-                    "segments": self.stb_segments_var.get(),
-                    "points_per_add": self.stb_points_var.get(),
-                    "spin_speed_range": [self.stb_min_speed_var.get(), self.stb_max_speed_var.get()],
-                    "win_color": self.stb_win_color_var.get(),
-                    "loss_color": self.stb_loss_color_var.get()
-                }
-            }
-        }
+        temp_config = {}
+        for path, key, attrs, _ in _SETTINGS_FIELDS:
+            section = temp_config
+            for part in path:
+                section = section.setdefault(part, {})
+
+            if isinstance(attrs, tuple):
+                section[key] = [getattr(self, attr).get() for attr in attrs]
+            else:
+                section[key] = getattr(self, attrs).get()
+
         return temp_config
\ No newline at end of file
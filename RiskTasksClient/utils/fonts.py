@@ -0,0 +1,24 @@
+"""
+Shared Fonts for Risk Tasks Client
+Caches CustomTkinter fonts so widgets reuse them instead of creating their own.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import customtkinter as ctk
+
+# Fonts by (size, weight). CTkFont takes no root and is always created on Tk's
+# default root, so one cache serves every window.
+_fonts: Dict[Tuple[Optional[int], str], ctk.CTkFont] = {}
+
+
+def get_font(size: Optional[int] = None, weight: str = "normal") -> ctk.CTkFont:
+    """Get the shared font of this size and weight, creating it on first use.
+
+    A size of None uses the theme's default font size.
+    """
+    key = (size, weight)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
@@ -169,7 +169,7 @@ class TaskScheduler:
             count = self.task_distribution.get(task, 0)
             stats[task] = {
                 'count': count,
-                'display_name': TaskType.get_display_name(TaskType(task)),
+                'display_name': TaskType.display_name_of(task),
                 'percentage': 0.0
             }
 
@@ -203,25 +203,32 @@ class TaskScheduler:
         Returns (is_valid, list_of_errors)
         """
         errors = []
+        valid_tasks = set(self.get_available_tasks())
 
         for participant_id, sessions in self.assignments.items():
-            # Check for duplicate tasks across sessions
-            all_tasks = []
-            for session_num, tasks in sessions.items():
-                all_tasks.extend(tasks)
-
-            if len(all_tasks) != len(set(all_tasks)):
+            # Check for duplicate tasks across sessions and invalid task names
+            # in a single pass over the participant's assignments
+            seen = set()
+            has_duplicates = False
+            invalid_tasks = []
+            for tasks in sessions.values():
+                for task in tasks:
+                    if task in seen:
+                        has_duplicates = True
+                    else:
+                        seen.add(task)
+                    if task not in valid_tasks:
+                        invalid_tasks.append(task)
+
+            if has_duplicates:
                 errors.append(
                     f"Participant {participant_id} has duplicate task assignments"
                 )
 
-            # Check for invalid task names
-            valid_tasks = self.get_available_tasks()
-            for task in all_tasks:
-                if task not in valid_tasks:
-                    errors.append(
-                        f"Invalid task '{task}' assigned to participant {participant_id}"
-                    )
+            for task in invalid_tasks:
+                errors.append(
+                    f"Invalid task '{task}' assigned to participant {participant_id}"
+                )
 
         return len(errors) == 0, errors
 
@@ -255,7 +262,7 @@ class TaskScheduler:
             export_data['assignments'][f"Participant_{participant_id}"] = {}
             for session_num, tasks in sessions.items():
                 task_names = [
-                    TaskType.get_display_name(TaskType(task))
+                    TaskType.display_name_of(task)
                     for task in tasks
                 ]
                 export_data['assignments'][f"Participant_{participant_id}"][f"Session_{session_num}"] = task_names